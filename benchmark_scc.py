@@ -0,0 +1,235 @@
+import sys, os, gc, json, time, random, platform, statistics, subprocess, tempfile, tracemalloc
+
+from grafo_scc import Grafo
+
+# Cada generador recibe la cantidad de aristas deseada y un random.Random ya
+# sembrado, y produce pares (origen, destino) de enteros.
+
+def generar_aleatorio(m, rng):
+    n = max(2, m // 4)
+    for _ in range(m):
+        yield rng.randrange(n), rng.randrange(n)
+
+def generar_potencia(m, rng):
+    # Muchos usuarios siguen a unos pocos creadores muy populares.
+    n = max(2, m // 4)
+    for _ in range(m):
+        yield rng.randrange(n), min(n - 1, int(rng.paretovariate(1.1)) - 1)
+
+def generar_cadena(m, rng):
+    for i in range(m):
+        yield i, i + 1
+
+def generar_gigante(m, rng):
+    n = max(2, m // 4)
+    for i in range(n):
+        yield i, (i + 1) % n
+    for _ in range(m - n):
+        yield rng.randrange(n), rng.randrange(n)
+
+def generar_pequenas(m, rng):
+    # Ciclos de 3 a 5 usuarios unidos solo hacia adelante: ninguna arista
+    # entre bloques cierra un ciclo, así que cada bloque es una comunidad.
+    inicio = 0
+    emitidas = 0
+    while emitidas < m:
+        tamano = rng.randint(3, 5)
+        for i in range(tamano):
+            yield inicio + i, inicio + (i + 1) % tamano
+        emitidas += tamano
+        if inicio and emitidas < m:
+            yield rng.randrange(inicio), inicio
+            emitidas += 1
+        inicio += tamano
+
+GENERADORES = {
+    "aleatorio": generar_aleatorio,
+    "potencia": generar_potencia,
+    "cadena": generar_cadena,
+    "gigante": generar_gigante,
+    "pequenas": generar_pequenas,
+}
+
+def _limpiar_grafo(red):
+    red["grafo"]._cache.clear()
+    return red["grafo"]
+
+def _limpiar_csr(red):
+    red["csr"]._recorte = None
+    return red["csr"]
+
+ALGORITMOS = {
+    "kosaraju": lambda red: _limpiar_grafo(red).kosaraju_scc(),
+    "tarjan": lambda red: _limpiar_grafo(red).tarjan_scc(),
+    "kosaraju_recortado": lambda red: _limpiar_grafo(red).kosaraju_scc(recortar=True),
+    "tarjan_recortado": lambda red: _limpiar_grafo(red).tarjan_scc(recortar=True),
+    "kosaraju_csr": lambda red: _limpiar_csr(red).kosaraju_scc(),
+    "tarjan_csr": lambda red: _limpiar_csr(red).tarjan_scc(),
+    "numpy": lambda red: red["csr"].scc(backend="numpy"),
+    "paralelo": lambda red: red["csr"].scc_paralelo(),
+}
+POR_DEFECTO = ["kosaraju", "tarjan", "kosaraju_csr", "tarjan_csr", "numpy"]
+
+def numpy_disponible():
+    try:
+        import scc_numpy
+    except ImportError:
+        return False
+    return True
+
+def leer_tamano(texto):
+    multiplicadores = {"k": 10 ** 3, "m": 10 ** 6}
+    sufijo = texto[-1].lower()
+    if sufijo in multiplicadores:
+        return int(float(texto[:-1]) * multiplicadores[sufijo])
+    return int(float(texto))
+
+def construir_red(generador, m, semilla):
+    # Las aristas pasan por un archivo temporal para que el grafo se arme con
+    # el mismo cargador por bloques que usa la herramienta de línea de comandos.
+    rng = random.Random(f"{generador}-{m}-{semilla}")
+    descriptor, ruta = tempfile.mkstemp(suffix=".tsv")
+    try:
+        with os.fdopen(descriptor, "w") as archivo:
+            for u, v in GENERADORES[generador](m, rng):
+                archivo.write(f"{u}\t{v}\n")
+        grafo = Grafo()
+        carga = grafo.cargar_aristas(ruta, separador="\t")
+    finally:
+        os.remove(ruta)
+    return {"grafo": grafo, "csr": grafo.compactar(), "carga": carga}
+
+def medir(funcion, red, repeticiones):
+    # La primera ejecución prepara lo que los motores guardan entre llamadas
+    # (por ejemplo el transpuesto CSR) y no se cuenta.
+    componentes = len(funcion(red))
+    tiempos = []
+    for _ in range(repeticiones):
+        gc.collect()
+        inicio = time.perf_counter()
+        funcion(red)
+        tiempos.append(time.perf_counter() - inicio)
+
+    # La memoria se mide en una pasada aparte porque tracemalloc hace más
+    # lenta cada asignación y deformaría los tiempos. tracemalloc solo ve los
+    # bloques vivos, no cuenta asignaciones: bloques_netos es cuántos bloques
+    # más quedan vivos después de la ejecución, ya descartado el resultado,
+    # es decir lo que el motor deja guardado en sus cachés.
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    resultado = funcion(red)
+    _, pico = tracemalloc.get_traced_memory()
+    del resultado
+    gc.collect()
+    despues = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    netos = sum(stat.count_diff for stat in despues.compare_to(antes, "filename"))
+
+    return {
+        "componentes": componentes,
+        "segundos": tiempos,
+        "mediana": statistics.median(tiempos),
+        "minimo": min(tiempos),
+        "memoria_pico": pico,
+        "bloques_netos": netos,
+    }
+
+def version_repositorio():
+    try:
+        salida = subprocess.run(["git", "describe", "--always", "--dirty"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return salida.stdout.strip() or None
+
+def ejecutar(generadores, tamanos, algoritmos, repeticiones, semilla, informe=sys.stderr):
+    resultados = []
+    for m in tamanos:
+        for generador in generadores:
+            red = construir_red(generador, m, semilla)
+            carga = red["carga"]
+            print(f"{generador} con {carga['aristas']} aristas y {carga['nodos']} nodos", file=informe)
+            for algoritmo in algoritmos:
+                medida = medir(ALGORITMOS[algoritmo], red, repeticiones)
+                print(f"  {algoritmo:<20} {medida['mediana']:9.4f} s  "
+                      f"{medida['memoria_pico'] / 2 ** 20:9.1f} MiB  {medida['componentes']} comunidades",
+                      file=informe)
+                resultados.append({"generador": generador, "aristas_pedidas": m, "aristas": carga["aristas"],
+                                   "nodos": carga["nodos"], "algoritmo": algoritmo, **medida})
+            del red
+            gc.collect()
+    return {
+        "version": version_repositorio(),
+        "python": platform.python_version(),
+        "implementacion": platform.python_implementation(),
+        "plataforma": platform.platform(),
+        "numpy": numpy_disponible(),
+        "semilla": semilla,
+        "repeticiones": repeticiones,
+        "resultados": resultados,
+    }
+
+def comparar(reporte, base, tolerancia, informe=sys.stderr):
+    clave = lambda r: (r["generador"], r["aristas_pedidas"], r["algoritmo"])
+    anteriores = {clave(r): r for r in base["resultados"]}
+    regresiones = 0
+    for r in reporte["resultados"]:
+        anterior = anteriores.get(clave(r))
+        if anterior is None:
+            continue
+        razon = r["mediana"] / anterior["mediana"] if anterior["mediana"] else 1.0
+        marca = ""
+        if razon > tolerancia:
+            marca = "  <-- regresión"
+            regresiones += 1
+        print(f"{r['generador']:<10} {r['aristas_pedidas']:>10} {r['algoritmo']:<20} x{razon:5.2f}{marca}",
+              file=informe)
+    return regresiones
+
+def main(argumentos=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Mide Kosaraju, Tarjan y los demás motores de SCC sobre grafos sintéticos")
+    parser.add_argument("--generadores", default=",".join(GENERADORES),
+                        help=f"lista separada por comas ({', '.join(GENERADORES)})")
+    parser.add_argument("--tamanos", default="1k,10k,100k",
+                        help="cantidades de aristas separadas por comas, admite sufijos k y M (hasta 10M)")
+    parser.add_argument("--algoritmos", default=",".join(POR_DEFECTO),
+                        help=f"lista separada por comas ({', '.join(ALGORITMOS)})")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--salida", help="archivo JSON del reporte (por defecto la salida estándar)")
+    parser.add_argument("--comparar", metavar="REPORTE", help="reporte JSON anterior contra el que comparar")
+    parser.add_argument("--tolerancia", type=float, default=1.25,
+                        help="razón de tiempos a partir de la cual se marca una regresión")
+    args = parser.parse_args(argumentos)
+
+    generadores = args.generadores.split(",")
+    algoritmos = args.algoritmos.split(",")
+    for nombre in generadores:
+        if nombre not in GENERADORES:
+            parser.error(f"generador desconocido: {nombre}")
+    for nombre in algoritmos:
+        if nombre not in ALGORITMOS:
+            parser.error(f"algoritmo desconocido: {nombre}")
+    if "numpy" in algoritmos and not numpy_disponible():
+        print("NumPy/SciPy no están instalados: 'numpy' mide el respaldo en Python puro", file=sys.stderr)
+
+    reporte = ejecutar(generadores, [leer_tamano(t) for t in args.tamanos.split(",")],
+                       algoritmos, args.repeticiones, args.semilla)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as salida:
+            json.dump(reporte, salida, indent=2)
+    else:
+        json.dump(reporte, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            regresiones = comparar(reporte, json.load(archivo), args.tolerancia)
+        return 1 if regresiones else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
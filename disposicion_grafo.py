@@ -0,0 +1,353 @@
+from itertools import chain
+
+import numpy as np
+
+# Fruchterman-Reingold con la variante de grilla del artículo original: la
+# repulsión solo se calcula entre nodos a menos de dos distancias ideales, así
+# que cada iteración es casi lineal. Las posiciones quedan en unidades de la
+# distancia ideal entre vecinos y los ejes se ajustan solos al dibujar.
+DISTANCIA = 1.0
+UMBRAL_DENSO = 500
+MAX_MOVILES = 500
+# En redes chicas cada cambio reacomoda a todos, partiendo de donde estaban.
+UMBRAL_GLOBAL = 100
+ITERACIONES_LOCALES = 15
+ITERACIONES_GRUESAS = 60
+ITERACIONES_REFINADO = 12
+MUESTRA_CELDA = 4
+
+def _tramos(inicios, cuantos):
+    # Concatena los rangos inicio, inicio + 1, ..., inicio + cuantos - 1.
+    base = np.repeat(inicios - np.cumsum(cuantos) + cuantos, cuantos)
+    return base + np.arange(len(base))
+
+class Grilla:
+    # Claves de las nueve celdas vecinas: la clave de (x, y) es x * 2**32 + y.
+    VECINAS = [(dx << 32) + dy for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+
+    def __init__(self, coordenadas, radio, rng=None):
+        self.radio = radio
+        self.rng = rng or np.random.default_rng(0)
+        claves = self._claves(coordenadas)
+        self.orden = np.argsort(claves, kind="stable")
+        claves = claves[self.orden]
+        cambios = np.flatnonzero(claves[1:] != claves[:-1]) + 1
+        self.inicios = np.concatenate(([0], cambios)) if len(claves) else cambios
+        self.cuantos = np.diff(np.concatenate((self.inicios, [len(claves)])))
+        self.celdas = claves[self.inicios]
+        self.coordenadas = coordenadas
+        if len(coordenadas):
+            self.minimos = coordenadas.min(axis=0)
+            self.maximos = coordenadas.max(axis=0)
+            self.esquina = np.floor(self.minimos / radio).astype(np.int64)
+            self.opuesta = np.floor(self.maximos / radio).astype(np.int64)
+
+    def _claves(self, puntos):
+        celdas = np.floor(puntos / self.radio).astype(np.int64)
+        return (celdas[:, 0] << 32) + celdas[:, 1]
+
+    def pares(self, puntos, muestra=None):
+        # Devuelve (i, j, peso) para cada punto i y cada fila j indexada que
+        # cae en su celda o en una de las ocho vecinas. Con `muestra`, de las
+        # celdas muy pobladas se toma un tramo al azar de ese tamaño y cada
+        # par pesa por los que representa, así el costo no depende de la
+        # densidad de la disposición.
+        claves = self._claves(puntos)
+        propios = np.arange(len(puntos))
+        ultima = len(self.celdas) - 1
+        izquierda = []
+        derecha = []
+        pesos = []
+        for vecina in self.VECINAS:
+            buscadas = claves + vecina
+            posicion = np.minimum(np.searchsorted(self.celdas, buscadas), max(ultima, 0))
+            cuantos = np.where(self.celdas[posicion] == buscadas, self.cuantos[posicion], 0)
+            inicio = self.inicios[posicion]
+            tomados = cuantos
+            if muestra is not None:
+                tomados = np.minimum(cuantos, muestra)
+                inicio = inicio + (self.rng.random(len(cuantos)) * (cuantos - tomados + 1)).astype(np.int64)
+            izquierda.append(np.repeat(propios, tomados))
+            derecha.append(self.orden[_tramos(inicio, tomados)])
+            pesos.append(np.repeat(cuantos / np.maximum(tomados, 1), tomados))
+        return np.concatenate(izquierda), np.concatenate(derecha), np.concatenate(pesos)
+
+    def en_rectangulo(self, x0, y0, x1, y1):
+        # Filas indexadas dentro del rectángulo. Como las claves ordenan las
+        # celdas por columna y después por fila, las celdas de una columna que
+        # cortan el rectángulo son contiguas, y también lo son sus puntos.
+        if not len(self.celdas):
+            return np.zeros(0, dtype=np.int64)
+        cx0, cy0 = np.maximum(np.floor(np.array([x0, y0]) / self.radio).astype(np.int64), self.esquina)
+        cx1, cy1 = np.minimum(np.floor(np.array([x1, y1]) / self.radio).astype(np.int64), self.opuesta)
+        if cx0 > cx1 or cy0 > cy1:
+            return np.zeros(0, dtype=np.int64)
+        columnas = np.arange(cx0, cx1 + 1) << 32
+        primera = np.searchsorted(self.celdas, columnas + cy0, side="left")
+        ultima = np.searchsorted(self.celdas, columnas + cy1, side="right")
+        finales = np.append(self.inicios, len(self.orden))
+        inicio = finales[primera]
+        filas = self.orden[_tramos(inicio, finales[ultima] - inicio)]
+        x, y = self.coordenadas[filas, 0], self.coordenadas[filas, 1]
+        return filas[(x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)]
+
+    def cercano(self, x, y, maximo=np.inf):
+        # Busca en cuadrados cada vez más grandes alrededor del punto: en
+        # cuanto aparece uno a no más de medio lado, ningún otro puede estar
+        # más cerca.
+        if not len(self.celdas):
+            return None
+        alcance = np.abs(np.concatenate((self.minimos - (x, y), self.maximos - (x, y)))).max()
+        lado = self.radio
+        while True:
+            cubre = lado >= alcance
+            filas = self.en_rectangulo(x - lado, y - lado, x + lado, y + lado)
+            if len(filas):
+                delta = self.coordenadas[filas] - (x, y)
+                d2 = np.einsum("ij,ij->i", delta, delta)
+                mejor = int(np.argmin(d2))
+                if d2[mejor] <= lado * lado or cubre:
+                    return int(filas[mejor]) if d2[mejor] <= maximo * maximo else None
+            if lado >= maximo or cubre:
+                return None
+            lado *= 2
+
+def _mover(coordenadas, filas, pares_i, pares_j, pesos, aristas_i, aristas_j, k, radio, temperatura):
+    # pares_i y aristas_i son posiciones dentro de `filas`; pares_j y
+    # aristas_j son filas de `coordenadas`.
+    puntos = coordenadas[filas]
+    m = len(filas)
+
+    delta = puntos[pares_i] - coordenadas[pares_j]
+    d2 = np.einsum("ij,ij->i", delta, delta)
+    cerca = (d2 > 0) & (d2 < radio * radio)
+    repulsion = delta[cerca] * (k * k * pesos[cerca] / d2[cerca])[:, None]
+    pares_i = pares_i[cerca]
+
+    delta = coordenadas[aristas_j] - puntos[aristas_i]
+    atraccion = delta * (np.sqrt(np.einsum("ij,ij->i", delta, delta)) / k)[:, None]
+
+    desplazamiento = np.empty((m, 2))
+    for eje in (0, 1):
+        desplazamiento[:, eje] = (np.bincount(pares_i, repulsion[:, eje], minlength=m)
+                                  + np.bincount(aristas_i, atraccion[:, eje], minlength=m))
+    largo = np.sqrt(np.einsum("ij,ij->i", desplazamiento, desplazamiento))
+    escala = np.minimum(largo, temperatura) / np.maximum(largo, 1e-12)
+    coordenadas[filas] = puntos + desplazamiento * escala[:, None]
+
+def relajar(coordenadas, u, v, k, iteraciones, temperatura, rng=None):
+    n = len(coordenadas)
+    if n == 0:
+        return coordenadas
+    todas = np.arange(n)
+    aristas_i = np.concatenate((u, v))
+    aristas_j = np.concatenate((v, u))
+    denso = n <= UMBRAL_DENSO
+    radio = np.inf if denso else 2 * k
+    for paso in range(iteraciones):
+        if denso:
+            pares_i, pares_j, pesos = np.repeat(todas, n), np.tile(todas, n), np.ones(n * n)
+        else:
+            pares_i, pares_j, pesos = Grilla(coordenadas, radio, rng).pares(coordenadas, MUESTRA_CELDA)
+        _mover(coordenadas, todas, pares_i, pares_j, pesos, aristas_i, aristas_j, k, radio,
+               temperatura * (1 - paso / iteraciones))
+    return coordenadas
+
+def engrosar(n, u, v, rng):
+    # Emparejamiento maximal al azar; los nodos que quedan sueltos se suman
+    # al grupo de algún vecino para que las estrellas también se reduzcan.
+    grupo = [-1] * n
+    grupos = 0
+    orden = rng.permutation(len(u))
+    origenes = u[orden].tolist()
+    destinos = v[orden].tolist()
+    for a, b in zip(origenes, destinos):
+        if a != b and grupo[a] < 0 and grupo[b] < 0:
+            grupo[a] = grupo[b] = grupos
+            grupos += 1
+    for a, b in zip(origenes, destinos):
+        if grupo[a] < 0 and grupo[b] >= 0:
+            grupo[a] = grupo[b]
+        elif grupo[b] < 0 and grupo[a] >= 0:
+            grupo[b] = grupo[a]
+    for a in range(n):
+        if grupo[a] < 0:
+            grupo[a] = grupos
+            grupos += 1
+
+    grupo = np.array(grupo, dtype=np.int64)
+    gu, gv = grupo[u], grupo[v]
+    distintas = gu != gv
+    claves = np.unique(gu[distintas] * grupos + gv[distintas])
+    return grupo, grupos, claves // grupos, claves % grupos
+
+def disposicion_multinivel(n, u, v, rng, k=DISTANCIA):
+    niveles = []
+    while n > UMBRAL_DENSO:
+        grupo, m, gu, gv = engrosar(n, u, v, rng)
+        if m > 0.9 * n:
+            break
+        niveles.append((grupo, u, v))
+        n, u, v = m, gu, gv
+
+    # Cada nivel grueso se dispone con una distancia ideal mayor, porque sus
+    # nodos representan varios nodos del nivel siguiente.
+    factor = np.sqrt(7 / 4)
+    k_nivel = k * factor ** len(niveles)
+    lado = k_nivel * np.sqrt(max(n, 1))
+    coordenadas = rng.random((n, 2)) * lado
+    relajar(coordenadas, u, v, k_nivel, ITERACIONES_GRUESAS, lado / 10, rng)
+
+    for grupo, u, v in reversed(niveles):
+        # Los miembros de un grupo se reparten alrededor de su posición en un
+        # disco proporcional al grupo, para no apilar miles en una celda.
+        k_nivel /= factor
+        dispersion = 0.5 * k_nivel * np.sqrt(np.bincount(grupo)[grupo])
+        coordenadas = coordenadas[grupo] + rng.normal(size=(len(grupo), 2)) * dispersion[:, None]
+        relajar(coordenadas, u, v, k_nivel, ITERACIONES_REFINADO, k_nivel, rng)
+    return coordenadas
+
+class Disposicion:
+    # Las filas de los nodos son estables salvo al quitar uno: la última fila
+    # pasa a ocupar su lugar y quitar() devuelve el nombre que se movió.
+    def __init__(self, semilla=42):
+        self.rng = np.random.default_rng(semilla)
+        self.reiniciar(())
+
+    def __len__(self):
+        return len(self.nombres)
+
+    @property
+    def coordenadas(self):
+        return self._buffer[:len(self.nombres)]
+
+    def reiniciar(self, nombres):
+        # La disposición completa se calcula recién en el próximo actualizar().
+        self.nombres = list(nombres)
+        self.indices = {nombre: i for i, nombre in enumerate(self.nombres)}
+        self._buffer = np.zeros((len(self.nombres), 2))
+        self.pendientes = {}
+        self.afectados = set()
+        self.completa = False
+
+    def agregar(self, nombre):
+        fila = len(self.nombres)
+        if fila == len(self._buffer):
+            self._buffer = np.concatenate((self._buffer, np.zeros((max(16, fila), 2))))
+        self._buffer[fila] = 0
+        self.nombres.append(nombre)
+        self.indices[nombre] = fila
+        self.pendientes[nombre] = None
+        return fila
+
+    def quitar(self, nombre):
+        fila = self.indices.pop(nombre)
+        self.pendientes.pop(nombre, None)
+        self.afectados.discard(nombre)
+        ultima = len(self.nombres) - 1
+        movido = None
+        if fila != ultima:
+            movido = self.nombres[ultima]
+            self.nombres[fila] = movido
+            self.indices[movido] = fila
+            self._buffer[fila] = self._buffer[ultima]
+        self.nombres.pop()
+        return movido
+
+    def marcar(self, *nombres):
+        self.afectados.update(nombres)
+
+    def recalcular(self, grafo):
+        adyacencia = grafo.adyacencia
+        indices = self.indices
+        cantidad = sum(map(len, adyacencia.values()))
+        u = np.fromiter((indices[a] for a, vecinos in adyacencia.items() for _ in vecinos), np.int64, cantidad)
+        v = np.fromiter((indices[b] for vecinos in adyacencia.values() for b in vecinos), np.int64, cantidad)
+        self._buffer = disposicion_multinivel(len(self.nombres), u, v, self.rng)
+        self.pendientes = {}
+        self.afectados = set()
+        self.completa = True
+
+    def actualizar(self, grafo):
+        # Devuelve las filas que se movieron, o None si se reacomodó la red
+        # entera.
+        if not self.completa or len(self.pendientes) > max(MAX_MOVILES, len(self.nombres) // 2):
+            self.recalcular(grafo)
+            return None
+        nuevos = list(self.pendientes)
+        if nuevos:
+            ubicadas = np.ones(len(self.nombres), dtype=bool)
+            ubicadas[[self.indices[n] for n in nuevos]] = False
+            caja = None
+            if ubicadas.any():
+                coordenadas = self.coordenadas[ubicadas]
+                caja = coordenadas.min(axis=0), coordenadas.max(axis=0)
+            for nombre in nuevos:
+                self._ubicar(nombre, grafo, caja)
+        moviles = [self.indices[n] for n in self.afectados.union(nuevos) if n in self.indices]
+        self.afectados = set()
+        moviles = np.array(moviles, dtype=np.int64)
+        if len(moviles) and (len(self.nombres) <= UMBRAL_GLOBAL or len(moviles) > MAX_MOVILES):
+            self._relajar_todo(grafo)
+            return None
+        if len(moviles):
+            self._refinar(moviles, grafo)
+        return moviles
+
+    def _vecinos(self, nombre, grafo):
+        return chain(grafo.adyacencia.get(nombre, ()), grafo.entrantes.get(nombre, ()))
+
+    def _ubicar(self, nombre, grafo, caja):
+        # Un nodo nuevo aparece junto a sus vecinos ya ubicados, o en algún
+        # punto al azar del área ocupada si todavía no tiene ninguno.
+        del self.pendientes[nombre]
+        indices = self.indices
+        vecinos = [indices[w] for w in self._vecinos(nombre, grafo) if w not in self.pendientes]
+        if vecinos:
+            centro = self._buffer[vecinos].mean(axis=0)
+        elif caja is not None:
+            minimo, maximo = caja
+            centro = minimo + self.rng.random(2) * (maximo - minimo)
+        else:
+            centro = np.zeros(2)
+        self._buffer[indices[nombre]] = centro + self.rng.normal(scale=0.3 * DISTANCIA, size=2)
+
+    def _refinar(self, moviles, grafo):
+        # Solo se mueven los nodos afectados; el resto de la red queda fijo y
+        # se indexa en la grilla una sola vez.
+        coordenadas = self.coordenadas
+        indices = self.indices
+        nombres = self.nombres
+        aristas_i = []
+        aristas_j = []
+        for local, fila in enumerate(moviles.tolist()):
+            for w in self._vecinos(nombres[fila], grafo):
+                aristas_i.append(local)
+                aristas_j.append(indices[w])
+        aristas_i = np.array(aristas_i, dtype=np.int64)
+        aristas_j = np.array(aristas_j, dtype=np.int64)
+
+        m = len(moviles)
+        es_movil = np.zeros(len(coordenadas), dtype=bool)
+        es_movil[moviles] = True
+        radio = 2 * DISTANCIA
+        grilla = Grilla(coordenadas, radio, self.rng)
+        entre_moviles_i = np.repeat(np.arange(m), m)
+        entre_moviles_j = np.tile(moviles, m)
+        entre_moviles_pesos = np.ones(m * m)
+        for paso in range(ITERACIONES_LOCALES):
+            pares_i, pares_j, pesos = grilla.pares(coordenadas[moviles], MUESTRA_CELDA)
+            fijos = ~es_movil[pares_j]
+            _mover(coordenadas, moviles,
+                   np.concatenate((pares_i[fijos], entre_moviles_i)),
+                   np.concatenate((pares_j[fijos], entre_moviles_j)),
+                   np.concatenate((pesos[fijos], entre_moviles_pesos)),
+                   aristas_i, aristas_j, DISTANCIA, np.inf,
+                   DISTANCIA * (1 - paso / ITERACIONES_LOCALES))
+
+    def _relajar_todo(self, grafo):
+        indices = self.indices
+        adyacencia = grafo.adyacencia
+        u = np.array([indices[a] for a, vecinos in adyacencia.items() for _ in vecinos], dtype=np.int64)
+        v = np.array([indices[b] for vecinos in adyacencia.values() for b in vecinos], dtype=np.int64)
+        relajar(self.coordenadas, u, v, DISTANCIA, ITERACIONES_REFINADO, DISTANCIA, self.rng)
@@ -0,0 +1,1300 @@
+#!/usr/bin/env python3
+import os, sys, time, mmap, struct, operator
+from array import array
+from collections import defaultdict, Counter
+from itertools import compress
+from types import MappingProxyType
+
+# Cabecera del snapshot binario: magia, versión, nodos, aristas y bytes de nombres.
+# Los arreglos que siguen se guardan en orden de bytes little-endian.
+SNAPSHOT_MAGIA = b"SCCG"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_CABECERA = struct.Struct("<4sIQQQ")
+
+class VecinosCSR:
+    def __init__(self, desplazamientos, destinos):
+        self.desplazamientos = desplazamientos
+        self.destinos = destinos
+    
+    def __getitem__(self, u):
+        return self.destinos[self.desplazamientos[u]:self.desplazamientos[u + 1]]
+
+class Recorte:
+    def __init__(self, triviales, nucleo, total):
+        self.triviales = triviales
+        self.nucleo = nucleo
+        self.total = total
+    
+    def informe(self):
+        return {
+            "nodos": self.total,
+            "recortados": len(self.triviales),
+            "nucleo": len(self.nucleo),
+            "fraccion": len(self.triviales) / self.total if self.total else 0.0,
+        }
+
+def recortar_triviales(nodos, adyacencia, entrantes, grado_entrada, grado_salida):
+    # Un vértice sin aristas de entrada o de salida (contando solo las que
+    # quedan) es una componente trivial; al quitarlo puede dejar a sus
+    # vecinos en la misma situación. Los vértices ya quitados quedan con
+    # grado -1 en ambos arreglos.
+    triviales = []
+    entrada = list(map(grado_entrada.__getitem__, nodos))
+    salida = list(map(grado_salida.__getitem__, nodos))
+    pendientes = list(compress(nodos, map(operator.not_, map(operator.mul, entrada, salida))))
+    while pendientes:
+        u = pendientes.pop()
+        if grado_entrada[u] < 0:
+            continue
+        grado_entrada[u] = grado_salida[u] = -1
+        triviales.append(u)
+        for v in adyacencia[u]:
+            grado = grado_entrada[v]
+            if grado > 0:
+                grado_entrada[v] = grado - 1
+                if grado == 1:
+                    pendientes.append(v)
+        for w in entrantes[u]:
+            grado = grado_salida[w]
+            if grado > 0:
+                grado_salida[w] = grado - 1
+                if grado == 1:
+                    pendientes.append(w)
+    
+    nucleo = dict.fromkeys(compress(nodos, map((0).__le__, map(grado_entrada.__getitem__, nodos))))
+    return Recorte(triviales, nucleo, len(triviales) + len(nucleo))
+
+def kosaraju_subgrafo(adyacencia, entrantes, nodos):
+    visitado = set()
+    pila = []
+    
+    for raiz in nodos:
+        if raiz in visitado:
+            continue
+        visitado.add(raiz)
+        recorrido = [raiz]
+        marcos = [iter(adyacencia[raiz])]
+        while marcos:
+            for v in marcos[-1]:
+                if v not in visitado and v in nodos:
+                    visitado.add(v)
+                    recorrido.append(v)
+                    marcos.append(iter(adyacencia[v]))
+                    break
+            else:
+                marcos.pop()
+                pila.append(recorrido.pop())
+    
+    visitado.clear()
+    componentes = []
+    
+    while pila:
+        raiz = pila.pop()
+        if raiz in visitado:
+            continue
+        visitado.add(raiz)
+        comp = [raiz]
+        marcos = [iter(entrantes[raiz])]
+        while marcos:
+            for v in marcos[-1]:
+                if v not in visitado and v in nodos:
+                    visitado.add(v)
+                    comp.append(v)
+                    marcos.append(iter(entrantes[v]))
+                    break
+            else:
+                marcos.pop()
+        componentes.append(comp)
+    
+    return componentes
+
+def tarjan_subgrafo(adyacencia, nodos):
+    indice = 0
+    indices = {}
+    low = {}
+    en_pila = set()
+    pila = []
+    componentes = []
+    
+    for raiz in nodos:
+        if raiz in indices:
+            continue
+        indices[raiz] = low[raiz] = indice
+        indice += 1
+        pila.append(raiz)
+        en_pila.add(raiz)
+        marcos = [(raiz, iter(adyacencia[raiz]))]
+        
+        while marcos:
+            v, vecinos = marcos[-1]
+            for w in vecinos:
+                if w not in nodos:
+                    continue
+                if w not in indices:
+                    indices[w] = low[w] = indice
+                    indice += 1
+                    pila.append(w)
+                    en_pila.add(w)
+                    marcos.append((w, iter(adyacencia[w])))
+                    break
+                elif w in en_pila and indices[w] < low[v]:
+                    low[v] = indices[w]
+            else:
+                marcos.pop()
+                if marcos:
+                    padre = marcos[-1][0]
+                    if low[v] < low[padre]:
+                        low[padre] = low[v]
+                
+                if low[v] == indices[v]:
+                    comp = []
+                    while True:
+                        w = pila.pop()
+                        en_pila.remove(w)
+                        comp.append(w)
+                        if w == v:
+                            break
+                    componentes.append(comp)
+    
+    return componentes
+
+def contar_grado(histograma, grado, cambio):
+    # histograma[g] es la cantidad de nodos con grado g; el último elemento
+    # nunca es cero, así que el grado máximo es len(histograma) - 1. Al mover
+    # un nodo de grado conviene sumar en el nuevo antes de restar en el viejo.
+    if grado == len(histograma):
+        histograma.append(0)
+    histograma[grado] += cambio
+    while histograma and not histograma[-1]:
+        histograma.pop()
+
+def histograma_grados(grados):
+    cantidades = Counter(grados)
+    return [cantidades[g] for g in range(max(cantidades, default=-1) + 1)]
+
+class SCCDinamico:
+    # Mantiene las componentes junto con un orden topológico de la
+    # condensación (Pearce-Kelly). Las claves de orden son tuplas para poder
+    # intercalar las partes de una componente que se divide.
+    PROFUNDIDAD_MAXIMA = 8
+    
+    def __init__(self, grafo):
+        self.grafo = grafo
+        self.componente = {}
+        self.miembros = {}
+        self.orden = {}
+        self.siguiente_id = 0
+        componentes = grafo.tarjan_scc()
+        for posicion, comp in enumerate(reversed(componentes)):
+            self._nueva_componente(comp, (posicion,), avisar=False)
+        self.siguiente_orden = len(componentes)
+    
+    def _nueva_componente(self, nodos, orden, avisar=True):
+        # Los ids de componente no se reutilizan: un nodo cambia de id solo
+        # cuando su comunidad se une con otra o se divide, y entonces el
+        # Grafo avisa comunidad_cambiada con los nodos afectados.
+        c = self.siguiente_id
+        self.siguiente_id += 1
+        self.miembros[c] = set(nodos)
+        self.orden[c] = orden
+        for nodo in nodos:
+            self.componente[nodo] = c
+        if avisar:
+            self.grafo._avisar("comunidad_cambiada", self.miembros[c], c)
+        return c
+    
+    def componentes(self):
+        return [list(self.miembros[c]) for c in sorted(self.miembros, key=self.orden.__getitem__)]
+    
+    def nodo_agregado(self, nombre):
+        self._nueva_componente([nombre], (self.siguiente_orden,))
+        self.siguiente_orden += 1
+    
+    def nodo_eliminado(self, nombre):
+        c = self.componente.pop(nombre)
+        self.miembros[c].discard(nombre)
+        if self.miembros[c]:
+            self._dividir(c)
+        else:
+            del self.miembros[c]
+            del self.orden[c]
+    
+    def arista_agregada(self, u, v):
+        cu = self.componente[u]
+        cv = self.componente[v]
+        if cu == cv or self.orden[cu] < self.orden[cv]:
+            return
+        
+        inferior, superior = self.orden[cv], self.orden[cu]
+        adelante = self._alcanzables(cv, self.grafo.adyacencia, lambda o: o <= superior)
+        atras = self._alcanzables(cu, self.grafo.entrantes, lambda o: o >= inferior)
+        posiciones = sorted(self.orden[c] for c in adelante | atras)
+        
+        ciclo = adelante & atras if cu in adelante else set()
+        previas = sorted(atras - ciclo, key=self.orden.__getitem__)
+        posteriores = sorted(adelante - ciclo, key=self.orden.__getitem__)
+        for c, posicion in zip(previas, posiciones):
+            self.orden[c] = posicion
+        if ciclo:
+            self.orden[self._fusionar(ciclo)] = posiciones[len(previas)]
+        for c, posicion in zip(posteriores, posiciones[len(posiciones) - len(posteriores):]):
+            self.orden[c] = posicion
+    
+    def arista_eliminada(self, u, v):
+        c = self.componente[u]
+        if c == self.componente[v] and not self._sigue_alcanzando(u, v, self.miembros[c]):
+            self._dividir(c)
+    
+    def _alcanzables(self, inicio, vecindad, dentro):
+        componente = self.componente
+        orden = self.orden
+        visitadas = {inicio}
+        pendientes = [inicio]
+        while pendientes:
+            c = pendientes.pop()
+            for nodo in self.miembros[c]:
+                for vecino in vecindad[nodo]:
+                    d = componente[vecino]
+                    if d not in visitadas and dentro(orden[d]):
+                        visitadas.add(d)
+                        pendientes.append(d)
+        return visitadas
+    
+    def _sigue_alcanzando(self, u, v, miembros):
+        # Si u llega a v por otro camino, la componente sigue siendo fuerte.
+        adyacencia = self.grafo.adyacencia
+        visitados = {u}
+        pendientes = [u]
+        while pendientes:
+            for w in adyacencia[pendientes.pop()]:
+                if w == v:
+                    return True
+                if w not in visitados and w in miembros:
+                    visitados.add(w)
+                    pendientes.append(w)
+        return False
+    
+    def _fusionar(self, componentes):
+        destino = max(componentes, key=lambda c: len(self.miembros[c]))
+        for c in componentes:
+            if c == destino:
+                continue
+            for nodo in self.miembros[c]:
+                self.componente[nodo] = destino
+            self.grafo._avisar("comunidad_cambiada", self.miembros[c], destino)
+            self.miembros[destino] |= self.miembros.pop(c)
+            del self.orden[c]
+        return destino
+    
+    def _dividir(self, c):
+        partes = tarjan_subgrafo(self.grafo.adyacencia, self.miembros[c])
+        if len(partes) == 1:
+            return
+        base = self.orden.pop(c)
+        del self.miembros[c]
+        for j, parte in enumerate(reversed(partes)):
+            self._nueva_componente(parte, base + (j,))
+        if len(base) >= self.PROFUNDIDAD_MAXIMA:
+            self._renumerar()
+    
+    def _renumerar(self):
+        for posicion, c in enumerate(sorted(self.miembros, key=self.orden.__getitem__)):
+            self.orden[c] = (posicion,)
+        self.siguiente_orden = len(self.miembros)
+
+class Condensacion:
+    # Las componentes se numeran en el orden en que Tarjan las cierra, que es
+    # un orden topológico inverso del DAG de componentes.
+    def __init__(self, componentes, componente, dag):
+        self.componentes = componentes
+        self.componente = componente
+        self.dag = dag
+        self.orden_topologico = list(range(len(componentes) - 1, -1, -1))
+        self._indice_alcance = None
+    
+    def __len__(self):
+        return len(self.componentes)
+    
+    def sucesores(self, c):
+        return self.dag[c]
+    
+    def aristas(self):
+        return [(c, d) for c, sucesores in enumerate(self.dag) for d in sucesores]
+    
+    def indice_alcance(self):
+        if self._indice_alcance is None:
+            self._indice_alcance = IndiceAlcance(self.dag)
+        return self._indice_alcance
+
+class IndiceAlcance:
+    # Etiquetado por intervalos al estilo GRAIL sobre el DAG de componentes.
+    # Cada recorrido en profundidad asigna a c su número en postorden y el
+    # mínimo postorden alcanzable; todo lo que c alcanza cae en
+    # [minimo[c], post[c]]. Con ids en orden topológico inverso, c solo puede
+    # alcanzar a d si d <= c.
+    RECORRIDOS = 2
+    
+    def __init__(self, dag):
+        self.dag = dag
+        self.etiquetas = [self._etiquetar(invertido=bool(k % 2)) for k in range(self.RECORRIDOS)]
+    
+    def _etiquetar(self, invertido):
+        dag = self.dag
+        n = len(dag)
+        post = array('i', [-1]) * n
+        inicio = array('i', bytes(4 * n))
+        minimo = array('i', bytes(4 * n))
+        contador = 0
+        
+        for raiz in range(n - 1, -1, -1):
+            if post[raiz] >= 0:
+                continue
+            post[raiz] = -2
+            inicio[raiz] = contador
+            nodos = [raiz]
+            marcos = [iter(reversed(dag[raiz]) if invertido else dag[raiz])]
+            while marcos:
+                for d in marcos[-1]:
+                    if post[d] == -1:
+                        post[d] = -2
+                        inicio[d] = contador
+                        nodos.append(d)
+                        marcos.append(iter(reversed(dag[d]) if invertido else dag[d]))
+                        break
+                else:
+                    marcos.pop()
+                    c = nodos.pop()
+                    post[c] = contador
+                    menor = inicio[c]
+                    for d in dag[c]:
+                        if minimo[d] < menor:
+                            menor = minimo[d]
+                    minimo[c] = menor
+                    contador += 1
+        
+        return post, inicio, minimo
+    
+    def _descartado(self, c, etiquetas_destino):
+        for (post, _, minimo), p in zip(self.etiquetas, etiquetas_destino):
+            if p < minimo[c] or p > post[c]:
+                return True
+        return False
+    
+    def alcanza(self, c, d):
+        if c == d:
+            return True
+        if d > c:
+            return False
+        etiquetas_destino = [post[d] for post, _, _ in self.etiquetas]
+        if self._descartado(c, etiquetas_destino):
+            return False
+        
+        post, inicio, _ = self.etiquetas[0]
+        objetivo = post[d]
+        if inicio[c] <= objetivo <= post[c]:
+            return True
+        
+        visitados = {c}
+        pendientes = [c]
+        while pendientes:
+            for e in self.dag[pendientes.pop()]:
+                if e == d:
+                    return True
+                if e < d or e in visitados:
+                    continue
+                visitados.add(e)
+                if self._descartado(e, etiquetas_destino):
+                    continue
+                if inicio[e] <= objetivo <= post[e]:
+                    return True
+                pendientes.append(e)
+        return False
+
+class Grafo:
+    def __init__(self):
+        self.adyacencia = defaultdict(dict)
+        self.entrantes = defaultdict(dict)
+        self.scc_dinamico = None
+        self.observadores = []
+        # Contadores que mantienen los mutadores para que las estadísticas
+        # no recorran la red.
+        self.cantidad_aristas = 0
+        self.aristas_reciprocas = 0
+        self.histograma_entrada = []
+        self.histograma_salida = []
+        self.version = 0
+        self._cache = {}
+        self._version_cache = 0
+    
+    def observar(self, observador):
+        # El observador recibe nodo_agregado, arista_agregada,
+        # arista_eliminada, nodo_eliminado y recargado, después de cada cambio.
+        # Una vez pedidas las comunidades recibe también comunidad_cambiada
+        # con los nodos que pasaron a otra comunidad y su nuevo id.
+        self.observadores.append(observador)
+    
+    def dejar_de_observar(self, observador):
+        self.observadores.remove(observador)
+    
+    def _avisar(self, evento, *datos):
+        for observador in self.observadores:
+            getattr(observador, evento)(*datos)
+    
+    def agregar_nodo(self, nombre):
+        if nombre not in self.adyacencia:
+            self.adyacencia[nombre] = {}
+            self.entrantes[nombre] = {}
+            contar_grado(self.histograma_entrada, 0, 1)
+            contar_grado(self.histograma_salida, 0, 1)
+            self.version += 1
+            # Los observadores se enteran del nodo antes que de su comunidad.
+            self._avisar("nodo_agregado", nombre)
+            if self.scc_dinamico is not None:
+                self.scc_dinamico.nodo_agregado(nombre)
+    
+    def agregar_arista(self, u, v):
+        self.agregar_nodo(u)
+        self.agregar_nodo(v)
+        if v not in self.adyacencia[u]:
+            self.adyacencia[u][v] = None
+            self.entrantes[v][u] = None
+            salida = len(self.adyacencia[u])
+            entrada = len(self.entrantes[v])
+            contar_grado(self.histograma_salida, salida, 1)
+            contar_grado(self.histograma_salida, salida - 1, -1)
+            contar_grado(self.histograma_entrada, entrada, 1)
+            contar_grado(self.histograma_entrada, entrada - 1, -1)
+            self.cantidad_aristas += 1
+            if u != v and u in self.adyacencia[v]:
+                self.aristas_reciprocas += 2
+            self.version += 1
+            if self.scc_dinamico is not None:
+                self.scc_dinamico.arista_agregada(u, v)
+            self._avisar("arista_agregada", u, v)
+    
+    def eliminar_nodo(self, nombre):
+        if nombre not in self.adyacencia:
+            return
+        salientes = self.adyacencia[nombre]
+        entrantes = self.entrantes[nombre]
+        contar_grado(self.histograma_salida, len(salientes), -1)
+        contar_grado(self.histograma_entrada, len(entrantes), -1)
+        self.cantidad_aristas -= len(salientes) + len(entrantes) - (nombre in salientes)
+        self.aristas_reciprocas -= 2 * sum(1 for v in salientes if v != nombre and v in entrantes)
+        
+        del self.adyacencia[nombre]
+        for v in salientes:
+            if v != nombre:
+                grado = len(self.entrantes[v])
+                contar_grado(self.histograma_entrada, grado - 1, 1)
+                contar_grado(self.histograma_entrada, grado, -1)
+            del self.entrantes[v][nombre]
+        del self.entrantes[nombre]
+        for u in entrantes:
+            grado = len(self.adyacencia[u])
+            contar_grado(self.histograma_salida, grado - 1, 1)
+            contar_grado(self.histograma_salida, grado, -1)
+            del self.adyacencia[u][nombre]
+        self.version += 1
+        if self.scc_dinamico is not None:
+            self.scc_dinamico.nodo_eliminado(nombre)
+        if self.observadores:
+            for v in salientes:
+                self._avisar("arista_eliminada", nombre, v)
+            for u in entrantes:
+                self._avisar("arista_eliminada", u, nombre)
+            self._avisar("nodo_eliminado", nombre)
+    
+    def eliminar_arista(self, u, v):
+        if u in self.adyacencia and v in self.adyacencia[u]:
+            salida = len(self.adyacencia[u])
+            entrada = len(self.entrantes[v])
+            contar_grado(self.histograma_salida, salida - 1, 1)
+            contar_grado(self.histograma_salida, salida, -1)
+            contar_grado(self.histograma_entrada, entrada - 1, 1)
+            contar_grado(self.histograma_entrada, entrada, -1)
+            del self.adyacencia[u][v]
+            del self.entrantes[v][u]
+            self.cantidad_aristas -= 1
+            if u != v and u in self.adyacencia[v]:
+                self.aristas_reciprocas -= 2
+            self.version += 1
+            if self.scc_dinamico is not None:
+                self.scc_dinamico.arista_eliminada(u, v)
+            self._avisar("arista_eliminada", u, v)
+    
+    def componentes(self):
+        return self._scc_dinamico().componentes()
+    
+    def comunidades(self):
+        # Id de comunidad de cada nodo, de solo lectura y siempre al día; los
+        # cambios llegan a los observadores con comunidad_cambiada.
+        return MappingProxyType(self._scc_dinamico().componente)
+    
+    def _scc_dinamico(self):
+        if self.scc_dinamico is None:
+            self.scc_dinamico = SCCDinamico(self)
+        return self.scc_dinamico
+    
+    def cargar_aristas(self, ruta, separador=None, tamano_bloque=1 << 20):
+        inicio = time.perf_counter()
+        adyacencia = self.adyacencia
+        entrantes = self.entrantes
+        internados = {}
+        lineas = aristas = duplicadas = reciprocas = ignoradas = 0
+        detectar = separador is None
+        
+        with open(ruta, encoding="utf-8") as archivo:
+            while True:
+                bloque = archivo.readlines(tamano_bloque)
+                if not bloque:
+                    break
+                for linea in bloque:
+                    lineas += 1
+                    if not linea.strip() or linea[0] in "#%":
+                        continue
+                    # Sin separador explícito se detecta en cada línea, para
+                    # no perder líneas de un archivo que mezcla formatos.
+                    if detectar:
+                        separador = "\t" if "\t" in linea else "," if "," in linea else None
+                    campos = linea.split(separador)
+                    if len(campos) < 2:
+                        ignoradas += 1
+                        continue
+                    u = campos[0].strip()
+                    v = campos[1].strip()
+                    if not u or not v:
+                        ignoradas += 1
+                        continue
+                    u = internados.setdefault(u, u)
+                    v = internados.setdefault(v, v)
+                    
+                    salientes = adyacencia.get(u)
+                    if salientes is None:
+                        salientes = adyacencia[u] = {}
+                        entrantes[u] = {}
+                    if v not in adyacencia:
+                        adyacencia[v] = {}
+                        entrantes[v] = {}
+                    if v in salientes:
+                        duplicadas += 1
+                        continue
+                    salientes[v] = None
+                    entrantes[v][u] = None
+                    aristas += 1
+                    if u != v and u in adyacencia[v]:
+                        reciprocas += 2
+        
+        # La carga masiva no pasa por los mutadores: se invalida todo una vez
+        # y los histogramas se rearman a partir de los grados.
+        self.cantidad_aristas += aristas
+        self.aristas_reciprocas += reciprocas
+        self._rearmar_histogramas()
+        self.version += 1
+        self.scc_dinamico = None
+        self._avisar("recargado")
+        segundos = time.perf_counter() - inicio
+        return {
+            "lineas": lineas,
+            "aristas": aristas,
+            "duplicadas": duplicadas,
+            "ignoradas": ignoradas,
+            "nodos": len(adyacencia),
+            "segundos": segundos,
+            "aristas_por_segundo": aristas / segundos if segundos > 0 else float("inf"),
+        }
+    
+    def _rearmar_histogramas(self):
+        self.histograma_entrada = histograma_grados(map(len, self.entrantes.values()))
+        self.histograma_salida = histograma_grados(map(len, self.adyacencia.values()))
+    
+    def estadisticas(self, histogramas=False):
+        # Todo sale de los contadores que mantienen los mutadores. Los
+        # histogramas tienen tantos elementos como el grado máximo, así que
+        # solo se copian si se piden; la barra lateral no los usa.
+        nodos = len(self.adyacencia)
+        aristas = self.cantidad_aristas
+        stats = {
+            "nodos": nodos,
+            "aristas": aristas,
+            "grado_medio": aristas / nodos if nodos else 0.0,
+            "max_entrada": max(len(self.histograma_entrada) - 1, 0),
+            "max_salida": max(len(self.histograma_salida) - 1, 0),
+            "reciprocidad": self.aristas_reciprocas / aristas if aristas else 0.0,
+        }
+        if histogramas:
+            stats["histograma_entrada"] = list(self.histograma_entrada)
+            stats["histograma_salida"] = list(self.histograma_salida)
+        return stats
+    
+    def nodos(self):
+        return list(self.adyacencia.keys())
+    
+    def seguidores(self, nombre):
+        return list(self.entrantes.get(nombre, ()))
+    
+    def siguiendo(self, nombre):
+        return list(self.adyacencia.get(nombre, ()))
+    
+    def in_degree(self, nombre):
+        return len(self.entrantes.get(nombre, ()))
+    
+    def out_degree(self, nombre):
+        return len(self.adyacencia.get(nombre, ()))
+    
+    def aristas(self):
+        aristas = []
+        for u, vecinos in self.adyacencia.items():
+            for v in vecinos:
+                aristas.append((u, v))
+        return aristas
+    
+    def compactar(self):
+        return GrafoCSR.desde_grafo(self)
+    
+    def scc_paralelo(self, procesos=None, verificar=False):
+        return self._memo_scc(("paralelo", procesos, verificar),
+                              lambda: self.compactar().scc_paralelo(procesos, verificar))
+    
+    def scc(self, backend="python"):
+        if backend == "numpy":
+            try:
+                from scc_numpy import scc_numpy
+            except ImportError:
+                backend = "python"
+            else:
+                return self._memo_scc("numpy", lambda: scc_numpy(self.compactar()))
+        if backend != "python":
+            raise ValueError(f"backend desconocido: {backend}")
+        return self.kosaraju_scc()
+    
+    def guardar_snapshot(self, ruta):
+        self.compactar().guardar(ruta)
+    
+    @staticmethod
+    def cargar_snapshot(ruta):
+        return GrafoCSR.cargar(ruta)
+    
+    def _memo(self, clave, calcular):
+        if self._version_cache != self.version:
+            self._cache.clear()
+            self._version_cache = self.version
+        if clave not in self._cache:
+            self._cache[clave] = calcular()
+        return self._cache[clave]
+    
+    def _scc_guardadas(self, clave, calcular):
+        # Las comunidades se guardan como tuplas para que nadie pueda
+        # modificar el caché a través de lo que devuelve un método público.
+        return self._memo(clave, lambda: tuple(map(tuple, calcular())))
+    
+    def _memo_scc(self, clave, calcular):
+        return [list(comp) for comp in self._scc_guardadas(clave, calcular)]
+    
+    def transpuesto(self):
+        return self.entrantes
+    
+    def recortar(self):
+        return self._memo("recorte", lambda: recortar_triviales(
+            self.adyacencia, self.adyacencia, self.entrantes,
+            dict(zip(self.entrantes, map(len, self.entrantes.values()))),
+            dict(zip(self.adyacencia, map(len, self.adyacencia.values())))))
+    
+    def _scc_recortado(self, algoritmo):
+        recorte = self.recortar()
+        if algoritmo == "kosaraju":
+            nucleo = kosaraju_subgrafo(self.adyacencia, self.entrantes, recorte.nucleo)
+        else:
+            nucleo = tarjan_subgrafo(self.adyacencia, recorte.nucleo)
+        return [[u] for u in recorte.triviales] + nucleo
+    
+    def kosaraju_scc(self, recortar=False):
+        if recortar:
+            return self._memo_scc("kosaraju_recortado", lambda: self._scc_recortado("kosaraju"))
+        return self._memo_scc("kosaraju", self._kosaraju_scc)
+    
+    def _kosaraju_scc(self):
+        adyacencia = self.adyacencia
+        visitado = set()
+        pila = []
+        
+        for raiz in adyacencia:
+            if raiz in visitado:
+                continue
+            visitado.add(raiz)
+            nodos = [raiz]
+            marcos = [iter(adyacencia[raiz])]
+            while marcos:
+                for v in marcos[-1]:
+                    if v not in visitado:
+                        visitado.add(v)
+                        nodos.append(v)
+                        marcos.append(iter(adyacencia[v]))
+                        break
+                else:
+                    marcos.pop()
+                    pila.append(nodos.pop())
+        
+        grafo_transpuesto = self.entrantes
+        visitado.clear()
+        componentes = []
+        
+        while pila:
+            raiz = pila.pop()
+            if raiz in visitado:
+                continue
+            visitado.add(raiz)
+            comp = [raiz]
+            marcos = [iter(grafo_transpuesto[raiz])]
+            while marcos:
+                for v in marcos[-1]:
+                    if v not in visitado:
+                        visitado.add(v)
+                        comp.append(v)
+                        marcos.append(iter(grafo_transpuesto[v]))
+                        break
+                else:
+                    marcos.pop()
+            componentes.append(comp)
+        
+        return componentes
+    
+    def tarjan_scc(self, recortar=False):
+        if recortar:
+            return self._memo_scc("tarjan_recortado", lambda: self._scc_recortado("tarjan"))
+        return self._memo_scc("tarjan", self._tarjan_scc)
+    
+    def _tarjan_scc(self):
+        adyacencia = self.adyacencia
+        indice = 0
+        indices = {}
+        low = {}
+        en_pila = set()
+        pila = []
+        componentes = []
+        
+        for raiz in adyacencia:
+            if raiz in indices:
+                continue
+            indices[raiz] = low[raiz] = indice
+            indice += 1
+            pila.append(raiz)
+            en_pila.add(raiz)
+            marcos = [(raiz, iter(adyacencia[raiz]))]
+            
+            while marcos:
+                v, vecinos = marcos[-1]
+                for w in vecinos:
+                    if w not in indices:
+                        indices[w] = low[w] = indice
+                        indice += 1
+                        pila.append(w)
+                        en_pila.add(w)
+                        marcos.append((w, iter(adyacencia[w])))
+                        break
+                    elif w in en_pila and indices[w] < low[v]:
+                        low[v] = indices[w]
+                else:
+                    marcos.pop()
+                    if marcos:
+                        padre = marcos[-1][0]
+                        if low[v] < low[padre]:
+                            low[padre] = low[v]
+                    
+                    if low[v] == indices[v]:
+                        comp = []
+                        while True:
+                            w = pila.pop()
+                            en_pila.remove(w)
+                            comp.append(w)
+                            if w == v:
+                                break
+                        componentes.append(comp)
+        
+        return componentes
+    
+    def condensacion(self):
+        return self._memo("condensacion", self._calcular_condensacion)
+    
+    def _calcular_condensacion(self):
+        # Parte del mismo recorrido de Tarjan que tarjan_scc(): las
+        # componentes salen en el orden en que se cierran, y el DAG solo se
+        # arma cuando alguien pide la condensación.
+        adyacencia = self.adyacencia
+        componentes = self._scc_guardadas("tarjan", self._tarjan_scc)
+        componente = {w: c for c, comp in enumerate(componentes) for w in comp}
+        dag = []
+        for c, comp in enumerate(componentes):
+            sucesores = {}
+            for w in comp:
+                for x in adyacencia[w]:
+                    d = componente[x]
+                    if d != c:
+                        sucesores[d] = None
+            dag.append(sucesores)
+        return Condensacion(componentes, componente, dag)
+    
+    def alcanza(self, u, v):
+        if u not in self.adyacencia or v not in self.adyacencia:
+            return False
+        condensacion = self.condensacion()
+        componente = condensacion.componente
+        return condensacion.indice_alcance().alcanza(componente[u], componente[v])
+
+class TablaNombres:
+    # Nombres de un snapshot mapeado: se decodifican solo cuando se piden.
+    def __init__(self, posiciones, bloque):
+        self.posiciones = posiciones
+        self.bloque = bloque
+    
+    def __len__(self):
+        return len(self.posiciones) - 1
+    
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return str(self.bloque[self.posiciones[i]:self.posiciones[i + 1]], "utf-8")
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+class GrafoCSR:
+    def __init__(self, nombres, desplazamientos, destinos):
+        self.nombres = nombres
+        self.desplazamientos = desplazamientos
+        self.destinos = destinos
+        self._transpuesto = None
+        self._recorte = None
+        self._mapa = None
+    
+    @classmethod
+    def desde_grafo(cls, grafo):
+        nombres = list(grafo.adyacencia)
+        indices = {nombre: i for i, nombre in enumerate(nombres)}
+        desplazamientos = array('q', [0])
+        destinos = array('i')
+        for u in nombres:
+            destinos.extend(indices[v] for v in grafo.adyacencia[u])
+            desplazamientos.append(len(destinos))
+        return cls(nombres, desplazamientos, destinos)
+    
+    @classmethod
+    def cargar(cls, ruta):
+        if sys.byteorder != "little":
+            raise ValueError("los snapshots solo pueden mapearse en máquinas little-endian")
+        with open(ruta, "rb") as archivo:
+            if not os.fstat(archivo.fileno()).st_size:
+                raise ValueError(f"{ruta} está vacío")
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            n, m, tamano_nombres = cls._validar(mapa, ruta)
+        except ValueError:
+            mapa.close()
+            raise
+        
+        vista = memoryview(mapa)
+        posicion = SNAPSHOT_CABECERA.size
+        desplazamientos = vista[posicion:posicion + 8 * (n + 1)].cast('q')
+        posicion += 8 * (n + 1)
+        destinos = vista[posicion:posicion + 4 * m].cast('i')
+        posicion += 4 * m + 4 * (m % 2)
+        posiciones = vista[posicion:posicion + 8 * (n + 1)].cast('q')
+        posicion += 8 * (n + 1)
+        bloque = vista[posicion:posicion + tamano_nombres]
+        
+        grafo = cls(TablaNombres(posiciones, bloque), desplazamientos, destinos)
+        grafo._mapa = mapa
+        return grafo
+    
+    @staticmethod
+    def _validar(mapa, ruta):
+        # Comprueba la cabecera contra el tamaño del archivo y después el
+        # contenido de los arreglos, antes de crear las vistas del grafo.
+        if len(mapa) < SNAPSHOT_CABECERA.size:
+            raise ValueError(f"{ruta} es demasiado corto para ser un snapshot de grafo")
+        magia, version, n, m, tamano_nombres = SNAPSHOT_CABECERA.unpack_from(mapa)
+        if magia != SNAPSHOT_MAGIA or version != SNAPSHOT_VERSION:
+            raise ValueError(f"{ruta} no es un snapshot de grafo válido")
+        
+        inicio_posiciones = SNAPSHOT_CABECERA.size + 8 * (n + 1) + 4 * m + 4 * (m % 2)
+        esperado = inicio_posiciones + 8 * (n + 1) + tamano_nombres
+        if len(mapa) != esperado:
+            raise ValueError(f"{ruta} tiene {len(mapa)} bytes y su cabecera indica {esperado}; "
+                             "el snapshot está truncado o dañado")
+        ultimo_destino, = struct.unpack_from("<q", mapa, SNAPSHOT_CABECERA.size + 8 * n)
+        ultima_posicion, = struct.unpack_from("<q", mapa, inicio_posiciones + 8 * n)
+        if ultimo_destino != m or ultima_posicion != tamano_nombres:
+            raise ValueError(f"{ruta} tiene arreglos que no coinciden con su cabecera")
+        if not GrafoCSR._arreglos_validos(mapa, n, m):
+            raise ValueError(f"{ruta} tiene desplazamientos o ids de nodo fuera de rango; "
+                             "el snapshot está dañado")
+        return n, m, tamano_nombres
+    
+    @staticmethod
+    def _arreglos_validos(mapa, n, m):
+        # array acepta índices negativos sin quejarse, así que un destino
+        # fuera de rango daría comunidades equivocadas en vez de un error.
+        # Se revisa todo una vez al cargar, con NumPy si está instalado. Las
+        # vistas son locales para que se liberen antes de cerrar el mapa.
+        inicio_destinos = SNAPSHOT_CABECERA.size + 8 * (n + 1)
+        inicio_posiciones = inicio_destinos + 4 * m + 4 * (m % 2)
+        try:
+            import numpy as np
+        except ImportError:
+            vista = memoryview(mapa)
+            desplazamientos = vista[SNAPSHOT_CABECERA.size:inicio_destinos].cast('q')
+            destinos = vista[inicio_destinos:inicio_destinos + 4 * m].cast('i')
+            posiciones = vista[inicio_posiciones:inicio_posiciones + 8 * (n + 1)].cast('q')
+            return (desplazamientos[0] == 0 and posiciones[0] == 0
+                    and all(map(operator.le, desplazamientos[:-1], desplazamientos[1:]))
+                    and all(map(operator.le, posiciones[:-1], posiciones[1:]))
+                    and (not m or (min(destinos) >= 0 and max(destinos) < n)))
+        desplazamientos = np.frombuffer(mapa, "<i8", n + 1, SNAPSHOT_CABECERA.size)
+        destinos = np.frombuffer(mapa, "<i4", m, inicio_destinos)
+        posiciones = np.frombuffer(mapa, "<i8", n + 1, inicio_posiciones)
+        return bool(desplazamientos[0] == 0 and posiciones[0] == 0
+                    and (np.diff(desplazamientos) >= 0).all() and (np.diff(posiciones) >= 0).all()
+                    and (not m or (destinos.min() >= 0 and destinos.max() < n)))
+    
+    def guardar(self, ruta):
+        if sys.byteorder != "little":
+            raise ValueError("los snapshots solo pueden escribirse en máquinas little-endian")
+        codificados = [str(nombre).encode("utf-8") for nombre in self.nombres]
+        posiciones = array('q', [0])
+        total = 0
+        for nombre in codificados:
+            total += len(nombre)
+            posiciones.append(total)
+        
+        n = len(self.nombres)
+        m = len(self.destinos)
+        with open(ruta, "wb") as archivo:
+            archivo.write(SNAPSHOT_CABECERA.pack(SNAPSHOT_MAGIA, SNAPSHOT_VERSION, n, m, total))
+            archivo.write(self.desplazamientos.tobytes())
+            archivo.write(self.destinos.tobytes())
+            archivo.write(bytes(4 * (m % 2)))
+            archivo.write(posiciones.tobytes())
+            for nombre in codificados:
+                archivo.write(nombre)
+    
+    def a_grafo(self):
+        grafo = Grafo()
+        nombres = list(self.nombres)
+        desplazamientos = self.desplazamientos
+        destinos = self.destinos
+        for u, nombre in enumerate(nombres):
+            grafo.adyacencia[nombre] = dict.fromkeys(nombres[v] for v in destinos[desplazamientos[u]:desplazamientos[u + 1]])
+            grafo.entrantes[nombre] = {}
+        for u, vecinos in grafo.adyacencia.items():
+            for v in vecinos:
+                grafo.entrantes[v][u] = None
+                if u != v and v in grafo.entrantes[u]:
+                    grafo.aristas_reciprocas += 2
+        grafo.cantidad_aristas = len(destinos)
+        grafo._rearmar_histogramas()
+        return grafo
+    
+    def cerrar(self):
+        if self._mapa is not None:
+            self._transpuesto = self._recorte = None
+            self.nombres = self.desplazamientos = self.destinos = None
+            self._mapa.close()
+            self._mapa = None
+    
+    def __len__(self):
+        return len(self.nombres)
+    
+    def nodos(self):
+        return list(self.nombres)
+    
+    def aristas(self):
+        nombres = self.nombres
+        desplazamientos = self.desplazamientos
+        destinos = self.destinos
+        aristas = []
+        for u in range(len(nombres)):
+            nombre = nombres[u]
+            for v in destinos[desplazamientos[u]:desplazamientos[u + 1]]:
+                aristas.append((nombre, nombres[v]))
+        return aristas
+    
+    def transpuesto(self):
+        if self._transpuesto is None:
+            n = len(self.nombres)
+            desplazamientos = self.desplazamientos
+            destinos = self.destinos
+            conteo = array('q', bytes(8 * (n + 1)))
+            for v in destinos:
+                conteo[v + 1] += 1
+            for i in range(n):
+                conteo[i + 1] += conteo[i]
+            siguiente = array('q', conteo)
+            origenes = array('i', bytes(4 * len(destinos)))
+            for u in range(n):
+                for v in destinos[desplazamientos[u]:desplazamientos[u + 1]]:
+                    origenes[siguiente[v]] = u
+                    siguiente[v] += 1
+            self._transpuesto = (conteo, origenes)
+        return self._transpuesto
+    
+    def scc_paralelo(self, procesos=None, verificar=False, umbral=None):
+        from scc_paralelo import scc_paralelo
+        return scc_paralelo(self, procesos, verificar, umbral)
+    
+    def scc(self, backend="python"):
+        if backend == "numpy":
+            try:
+                from scc_numpy import scc_numpy
+            except ImportError:
+                backend = "python"
+            else:
+                return scc_numpy(self)
+        if backend != "python":
+            raise ValueError(f"backend desconocido: {backend}")
+        return self.kosaraju_scc()
+    
+    def recortar(self):
+        if self._recorte is None:
+            n = len(self.nombres)
+            desplazamientos = self.desplazamientos
+            desplazamientos_t, origenes = self.transpuesto()
+            grado_salida = array('i', map(operator.sub, desplazamientos[1:], desplazamientos[:-1]))
+            grado_entrada = array('i', map(operator.sub, desplazamientos_t[1:], desplazamientos_t[:-1]))
+            self._recorte = recortar_triviales(range(n), VecinosCSR(desplazamientos, self.destinos),
+                                               VecinosCSR(desplazamientos_t, origenes),
+                                               grado_entrada, grado_salida)
+        return self._recorte
+    
+    def _scc_recortado(self, algoritmo):
+        recorte = self.recortar()
+        adelante = VecinosCSR(self.desplazamientos, self.destinos)
+        if algoritmo == "kosaraju":
+            nucleo = kosaraju_subgrafo(adelante, VecinosCSR(*self.transpuesto()), recorte.nucleo)
+        else:
+            nucleo = tarjan_subgrafo(adelante, recorte.nucleo)
+        nombres = self.nombres
+        return [[nombres[u]] for u in recorte.triviales] + [[nombres[u] for u in comp] for comp in nucleo]
+    
+    def kosaraju_scc(self, recortar=False):
+        if recortar:
+            return self._scc_recortado("kosaraju")
+        n = len(self.nombres)
+        desplazamientos = self.desplazamientos
+        destinos = self.destinos
+        visitado = bytearray(n)
+        pila = array('i')
+        
+        for raiz in range(n):
+            if visitado[raiz]:
+                continue
+            visitado[raiz] = 1
+            nodos = [raiz]
+            marcos = [iter(destinos[desplazamientos[raiz]:desplazamientos[raiz + 1]])]
+            while marcos:
+                for v in marcos[-1]:
+                    if not visitado[v]:
+                        visitado[v] = 1
+                        nodos.append(v)
+                        marcos.append(iter(destinos[desplazamientos[v]:desplazamientos[v + 1]]))
+                        break
+                else:
+                    marcos.pop()
+                    pila.append(nodos.pop())
+        
+        desplazamientos_t, origenes = self.transpuesto()
+        visitado = bytearray(n)
+        nombres = self.nombres
+        componentes = []
+        
+        for raiz in reversed(pila):
+            if visitado[raiz]:
+                continue
+            visitado[raiz] = 1
+            comp = [nombres[raiz]]
+            marcos = [iter(origenes[desplazamientos_t[raiz]:desplazamientos_t[raiz + 1]])]
+            while marcos:
+                for v in marcos[-1]:
+                    if not visitado[v]:
+                        visitado[v] = 1
+                        comp.append(nombres[v])
+                        marcos.append(iter(origenes[desplazamientos_t[v]:desplazamientos_t[v + 1]]))
+                        break
+                else:
+                    marcos.pop()
+            componentes.append(comp)
+        
+        return componentes
+    
+    def tarjan_scc(self, recortar=False):
+        if recortar:
+            return self._scc_recortado("tarjan")
+        n = len(self.nombres)
+        desplazamientos = self.desplazamientos
+        destinos = self.destinos
+        nombres = self.nombres
+        indices = array('i', [-1]) * n
+        low = array('i', bytes(4 * n))
+        en_pila = bytearray(n)
+        pila = []
+        componentes = []
+        indice = 0
+        
+        for raiz in range(n):
+            if indices[raiz] >= 0:
+                continue
+            indices[raiz] = low[raiz] = indice
+            indice += 1
+            pila.append(raiz)
+            en_pila[raiz] = 1
+            nodos = [raiz]
+            marcos = [iter(destinos[desplazamientos[raiz]:desplazamientos[raiz + 1]])]
+            
+            while marcos:
+                v = nodos[-1]
+                for w in marcos[-1]:
+                    if indices[w] < 0:
+                        indices[w] = low[w] = indice
+                        indice += 1
+                        pila.append(w)
+                        en_pila[w] = 1
+                        nodos.append(w)
+                        marcos.append(iter(destinos[desplazamientos[w]:desplazamientos[w + 1]]))
+                        break
+                    elif en_pila[w] and indices[w] < low[v]:
+                        low[v] = indices[w]
+                else:
+                    marcos.pop()
+                    nodos.pop()
+                    if nodos and low[v] < low[nodos[-1]]:
+                        low[nodos[-1]] = low[v]
+                    
+                    if low[v] == indices[v]:
+                        comp = []
+                        while True:
+                            w = pila.pop()
+                            en_pila[w] = 0
+                            comp.append(nombres[w])
+                            if w == v:
+                                break
+                        componentes.append(comp)
+        
+        return componentes
+
+def cargar_red(ruta, separador=None, informe=sys.stdout):
+    if ruta.endswith(".sccg"):
+        inicio = time.perf_counter()
+        try:
+            grafo = Grafo.cargar_snapshot(ruta)
+        except ValueError as error:
+            sys.exit(f"No se pudo abrir el snapshot: {error}")
+        print(f"Snapshot con {len(grafo)} nodos y {len(grafo.destinos)} aristas "
+              f"mapeado en {(time.perf_counter() - inicio) * 1000:.2f} ms", file=informe)
+    else:
+        grafo = Grafo()
+        carga = grafo.cargar_aristas(ruta, separador=separador)
+        print(f"Cargadas {carga['aristas']} aristas ({carga['duplicadas']} duplicadas) "
+              f"entre {carga['nodos']} nodos en {carga['segundos']:.3f} s "
+              f"({carga['aristas_por_segundo']:,.0f} aristas/s)", file=informe)
+        if carga["ignoradas"]:
+            print(f"Se ignoraron {carga['ignoradas']} líneas mal formadas", file=informe)
+    return grafo
+
+def calcular_scc(grafo, algoritmo, procesos=None, recortar=False, verificar=False):
+    inicio = time.perf_counter()
+    if algoritmo == "paralelo":
+        # El motor paralelo recorta siempre, dentro de cada subconjunto.
+        componentes = grafo.scc_paralelo(procesos, verificar)
+    elif algoritmo == "numpy":
+        componentes = grafo.scc(backend="numpy")
+    elif algoritmo == "kosaraju":
+        componentes = grafo.kosaraju_scc(recortar=recortar)
+    else:
+        componentes = grafo.tarjan_scc(recortar=recortar)
+    return componentes, time.perf_counter() - inicio
+
+def informar_recorte(grafo, informe):
+    datos = grafo.recortar().informe()
+    print(f"Recorte: {datos['recortados']} de {datos['nodos']} nodos ({datos['fraccion']:.1%}) "
+          f"eran comunidades triviales; núcleo de {datos['nucleo']} nodos", file=informe)
+
+def escribir_componentes(componentes, salida, formato):
+    if formato == "csv":
+        import csv
+        escritor = csv.writer(salida)
+        escritor.writerow(["usuario", "comunidad"])
+        for i, comp in enumerate(componentes):
+            for usuario in comp:
+                escritor.writerow([usuario, i])
+    else:
+        import json
+        json.dump({"comunidades": componentes}, salida, ensure_ascii=False)
+        salida.write("\n")
+
+def comando_resumen(args):
+    grafo = cargar_red(args.archivo, args.separador)
+    if args.guardar:
+        if isinstance(grafo, GrafoCSR):
+            grafo.guardar(args.guardar)
+        else:
+            grafo.guardar_snapshot(args.guardar)
+        print(f"Snapshot guardado en {args.guardar}")
+    
+    componentes, tiempo = calcular_scc(grafo, args.algoritmo, args.procesos, args.recortar, args.verificar)
+    if args.recortar:
+        informar_recorte(grafo, sys.stdout)
+    print(f"{args.algoritmo}: {len(componentes)} comunidades en {tiempo:.3f} s")
+    
+    for i, comp in enumerate(sorted(componentes, key=len, reverse=True)[:args.top], 1):
+        muestra = ", ".join(map(str, comp[:5])) + (", ..." if len(comp) > 5 else "")
+        print(f"  {i}. tamaño={len(comp)}: {muestra}")
+    return 0
+
+def comando_scc(args):
+    grafo = cargar_red(args.archivo, args.separador, informe=sys.stderr)
+    componentes, tiempo = calcular_scc(grafo, args.algoritmo, args.procesos, args.recortar, args.verificar)
+    if args.recortar:
+        informar_recorte(grafo, sys.stderr)
+    print(f"{args.algoritmo}: {len(componentes)} comunidades en {tiempo:.3f} s", file=sys.stderr)
+    
+    formato = args.formato or ("csv" if args.salida and args.salida.endswith(".csv") else "json")
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8", newline="") as salida:
+            escribir_componentes(componentes, salida, formato)
+    else:
+        escribir_componentes(componentes, sys.stdout, formato)
+    return 0
+
+def main(argumentos=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Análisis de comunidades (SCC) sin interfaz gráfica")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+    
+    comunes = argparse.ArgumentParser(add_help=False)
+    comunes.add_argument("archivo", help="lista de aristas 'origen destino' (CSV, TSV o separada por espacios) o snapshot .sccg")
+    comunes.add_argument("--algoritmo", choices=["kosaraju", "tarjan", "paralelo", "numpy"], default="tarjan")
+    comunes.add_argument("--procesos", type=int, default=None, help="procesos para --algoritmo paralelo")
+    comunes.add_argument("--verificar", action="store_true",
+                         help="compara el resultado de --algoritmo paralelo con Tarjan secuencial")
+    comunes.add_argument("--recortar", action="store_true",
+                         help="separa primero los nodos sin entradas o sin salidas "
+                              "(--algoritmo paralelo recorta siempre)")
+    comunes.add_argument("--separador", default=None, help="separador de columnas (se detecta si se omite)")
+    
+    resumen = subcomandos.add_parser("resumen", parents=[comunes], help="muestra las comunidades más grandes")
+    resumen.add_argument("--top", type=int, default=10, help="cuántas comunidades mostrar")
+    resumen.add_argument("--guardar", metavar="SNAPSHOT", help="guarda la red cargada como snapshot binario")
+    resumen.set_defaults(funcion=comando_resumen)
+    
+    scc = subcomandos.add_parser("scc", parents=[comunes], help="escribe todas las comunidades en JSON o CSV")
+    scc.add_argument("--formato", choices=["json", "csv"], help="formato de salida (json por defecto)")
+    scc.add_argument("--salida", help="archivo de salida (por defecto la salida estándar)")
+    scc.set_defaults(funcion=comando_scc)
+    
+    args = parser.parse_args(argumentos)
+    return args.funcion(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
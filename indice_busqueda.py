@@ -0,0 +1,110 @@
+from bisect import bisect_left, bisect_right, insort
+from heapq import merge
+from itertools import accumulate, chain, islice
+
+# Cambios que se acumulan aparte antes de volver a armar el texto completo.
+MIN_CAMBIOS_TEXTO = 1000
+
+class IndiceBusqueda:
+    # Búsqueda de usuarios por prefijo y por subcadena, sin distinguir
+    # mayúsculas. Las claves (nombre en minúsculas, nombre) se guardan
+    # ordenadas, así que los que empiezan con la consulta forman un tramo
+    # contiguo que se encuentra con bisect. Para las subcadenas se arma un
+    # solo texto con todas las claves separadas por saltos de línea, en el
+    # que str.find recorre millones de nombres sin pasar por Python; los
+    # usuarios creados o eliminados después se llevan aparte hasta que son
+    # demasiados y conviene rearmarlo. Las claves se ordenan en la primera
+    # búsqueda y el texto en la primera que necesita subcadenas.
+    def __init__(self, grafo):
+        self.grafo = grafo
+        self.claves = None
+        self.texto = None
+        grafo.observar(self)
+
+    def recargado(self):
+        self.claves = None
+        self.texto = None
+
+    def nodo_agregado(self, nombre):
+        if self.claves is None:
+            return
+        clave = (nombre.lower(), nombre)
+        insort(self.claves, clave)
+        if self.texto is not None:
+            insort(self.agregados, clave)
+            self._contar_cambio()
+
+    def nodo_eliminado(self, nombre):
+        if self.claves is None:
+            return
+        clave = (nombre.lower(), nombre)
+        posicion = bisect_left(self.claves, clave)
+        if posicion < len(self.claves) and self.claves[posicion] == clave:
+            del self.claves[posicion]
+        if self.texto is not None:
+            posicion = bisect_left(self.agregados, clave)
+            if posicion < len(self.agregados) and self.agregados[posicion] == clave:
+                del self.agregados[posicion]
+            else:
+                self.quitados.add(clave)
+                self._contar_cambio()
+
+    def arista_agregada(self, u, v):
+        pass
+
+    def arista_eliminada(self, u, v):
+        pass
+
+    def comunidad_cambiada(self, nodos, c):
+        pass
+
+    def _contar_cambio(self):
+        if len(self.agregados) + len(self.quitados) > max(MIN_CAMBIOS_TEXTO, len(self.claves) // 100):
+            self.texto = None
+
+    def _armar_texto(self):
+        if self.texto is None:
+            self.base = list(self.claves)
+            self.texto = "\n".join(clave for clave, _ in self.base) + "\n"
+            self.inicios = list(accumulate((len(clave) + 1 for clave, _ in self.base), initial=0))
+            self.agregados = []
+            self.quitados = set()
+
+    def _en_texto(self, consulta):
+        # Claves del texto que contienen la consulta sin empezar con ella, en
+        # orden; cada nombre aparece una sola vez aunque la contenga varias.
+        texto = self.texto
+        inicios = self.inicios
+        base = self.base
+        posicion = texto.find(consulta)
+        while posicion >= 0:
+            fila = bisect_right(inicios, posicion) - 1
+            if posicion != inicios[fila]:
+                yield base[fila]
+            posicion = texto.find(consulta, inicios[fila + 1])
+
+    def coincidencias(self, consulta):
+        if self.claves is None:
+            self.claves = sorted((nombre.lower(), nombre) for nombre in self.grafo.adyacencia)
+        consulta = consulta.lower()
+        claves = self.claves
+        inicio = bisect_left(claves, (consulta,))
+        fin = bisect_left(claves, (consulta + "\U0010ffff",))
+        prefijos = (claves[fila][1] for fila in range(inicio, fin))
+        if not consulta or "\n" in consulta:
+            return prefijos
+
+        self._armar_texto()
+        en_texto = self._en_texto(consulta)
+        if self.quitados:
+            en_texto = (clave for clave in en_texto if clave not in self.quitados)
+        agregados = [clave for clave in self.agregados
+                     if consulta in clave[0] and not clave[0].startswith(consulta)]
+        return chain(prefijos, (nombre for _, nombre in merge(en_texto, agregados)))
+
+    def buscar(self, consulta, desde=0, cantidad=50, excluir=None):
+        # Devuelve una página de resultados, primero los que empiezan con la
+        # consulta, y si quedan más después de ella.
+        resultados = (nombre for nombre in self.coincidencias(consulta) if nombre != excluir)
+        pagina = list(islice(resultados, desde, desde + cantidad + 1))
+        return pagina[:cantidad], len(pagina) > cantidad
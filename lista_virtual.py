@@ -0,0 +1,151 @@
+import tkinter as tk
+import customtkinter as ctk
+
+# Cuántas filas avanza cada paso de la rueda del ratón.
+FILAS_POR_PASO = 3
+
+class ListaVirtual(ctk.CTkFrame):
+    # Lista desplazable para secuencias largas: solo existen los widgets de
+    # las filas que entran en la vista, y al desplazarse cada fila que sale
+    # por un borde se vuelve a llenar con el elemento que entra por el otro.
+    # `crear_fila(padre)` arma una fila vacía y `llenar_fila(fila, elemento)`
+    # la actualiza para mostrar un elemento. Si `pedir_mas` no es None, se
+    # llama cuando la vista llega al final para que agregue elementos a la
+    # misma lista y vuelva a dibujar.
+    def __init__(self, master, crear_fila, llenar_fila, separacion=4, margen=5, pedir_mas=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.crear_fila = crear_fila
+        self.llenar_fila = llenar_fila
+        self.pedir_mas = pedir_mas
+        self.pidiendo = False
+        self.separacion = separacion
+        self.margen = margen
+        self.elementos = []
+        self.filas = []
+        self.ventanas = []
+        self.indices = []
+        self.alto_fila = None
+        self.desplazamiento = 0
+
+        color = self._fg_color if self._fg_color != "transparent" else self._bg_color
+        self.lienzo = tk.Canvas(self, highlightthickness=0, borderwidth=0,
+                                bg=self._apply_appearance_mode(color))
+        self.barra = ctk.CTkScrollbar(self, command=self.al_mover_barra)
+        self.barra.pack(side="right", fill="y")
+        self.lienzo.pack(side="left", fill="both", expand=True)
+        self.lienzo.bind("<Configure>", lambda event: self.dibujar())
+        self.enlazar_rueda(self.lienzo)
+
+    def mostrar(self, elementos):
+        self.elementos = elementos
+        self.desplazamiento = 0
+        self.refrescar()
+
+    def refrescar(self):
+        # Vuelve a llenar las filas visibles, por ejemplo después de que
+        # cambió el estado de algún elemento.
+        self.indices = [None] * len(self.filas)
+        self.dibujar()
+
+    def refrescar_elemento(self, elemento):
+        # Vuelve a llenar solo las filas visibles que muestran este elemento.
+        for posicion, indice in enumerate(self.indices):
+            if indice is not None and indice < len(self.elementos) and self.elementos[indice] == elemento:
+                self.llenar_fila(self.filas[posicion], elemento)
+
+    def quitar(self, elemento):
+        if elemento in self.elementos:
+            self.elementos.remove(elemento)
+            self.refrescar()
+
+    def enlazar_rueda(self, widget):
+        pendientes = [widget]
+        while pendientes:
+            actual = pendientes.pop()
+            for secuencia in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                tk.Misc.bind(actual, secuencia, self.al_girar_rueda, "+")
+            pendientes.extend(actual.winfo_children())
+
+    def nueva_fila(self):
+        fila = self.crear_fila(self.lienzo)
+        self.enlazar_rueda(fila)
+        self.filas.append(fila)
+        self.ventanas.append(self.lienzo.create_window(0, 0, window=fila, anchor="nw", state="hidden"))
+        self.indices.append(None)
+        if self.alto_fila is None:
+            fila.update_idletasks()
+            self.alto_fila = fila.winfo_reqheight() + self.separacion
+
+    def dibujar(self):
+        alto = self.lienzo.winfo_height()
+        ancho = self.lienzo.winfo_width()
+        total = len(self.elementos)
+        if total and not self.filas:
+            self.nueva_fila()
+        if not self.filas:
+            self.barra.set(0, 1)
+            return
+
+        # Cada elemento va siempre a la fila indice % len(filas); así, al
+        # desplazarse, solo se vuelven a llenar las filas que cambian.
+        necesarias = min(total, alto // self.alto_fila + 2)
+        if necesarias > len(self.filas):
+            while len(self.filas) < necesarias:
+                self.nueva_fila()
+            self.indices = [None] * len(self.filas)
+
+        largo = total * self.alto_fila
+        self.desplazamiento = max(0, min(self.desplazamiento, largo - alto))
+        primero = self.desplazamiento // self.alto_fila
+        usadas = set()
+        for indice in range(primero, min(total, primero + necesarias)):
+            posicion = indice % len(self.filas)
+            usadas.add(posicion)
+            if self.indices[posicion] != indice:
+                self.llenar_fila(self.filas[posicion], self.elementos[indice])
+                self.indices[posicion] = indice
+            self.lienzo.coords(self.ventanas[posicion], self.margen,
+                               indice * self.alto_fila - self.desplazamiento)
+            self.lienzo.itemconfigure(self.ventanas[posicion], width=max(1, ancho - 2 * self.margen),
+                                      state="normal")
+        for posicion, ventana in enumerate(self.ventanas):
+            if posicion not in usadas:
+                self.lienzo.itemconfigure(ventana, state="hidden")
+
+        if largo > alto:
+            self.barra.set(self.desplazamiento / largo, (self.desplazamiento + alto) / largo)
+        else:
+            self.barra.set(0, 1)
+
+        if self.pedir_mas is not None and not self.pidiendo and primero + necesarias >= total:
+            self.pidiendo = True
+            self.after_idle(self.completar)
+
+    def completar(self):
+        self.pidiendo = False
+        if self.pedir_mas is not None and self.winfo_exists():
+            self.pedir_mas()
+
+    def al_mover_barra(self, accion, cantidad, unidad=None):
+        largo = len(self.elementos) * (self.alto_fila or 0)
+        if accion == "moveto":
+            self.desplazamiento = int(float(cantidad) * largo)
+        elif unidad == "pages":
+            self.desplazamiento += int(cantidad) * self.lienzo.winfo_height()
+        else:
+            self.desplazamiento += int(cantidad) * (self.alto_fila or 0)
+        self.dibujar()
+
+    def al_girar_rueda(self, event):
+        if self.alto_fila is None:
+            return "break"
+        if event.num == 4:
+            pasos = -1
+        elif event.num == 5:
+            pasos = 1
+        else:
+            # En Windows cada paso vale 120; en macOS llegan valores chicos.
+            pasos = -event.delta / 120 if abs(event.delta) >= 120 else -event.delta
+        self.desplazamiento += int(pasos * FILAS_POR_PASO * self.alto_fila)
+        self.dibujar()
+        return "break"
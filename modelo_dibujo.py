@@ -0,0 +1,107 @@
+import numpy as np
+from matplotlib.colors import to_rgba_array
+
+from disposicion_grafo import Disposicion
+
+class ModeloDibujo:
+    # Copia de la red lista para dibujar: las filas de nodos son las de la
+    # disposición y cada arista guarda las filas de sus extremos. Se mantiene
+    # al día con los avisos del Grafo, sin volver a recorrerlo en cada dibujo.
+    def __init__(self, grafo):
+        self.grafo = grafo
+        self.disposicion = Disposicion()
+        self.recargado()
+        grafo.observar(self)
+
+    @property
+    def nombres(self):
+        return self.disposicion.nombres
+
+    @property
+    def indices(self):
+        return self.disposicion.indices
+
+    @property
+    def coordenadas(self):
+        return self.disposicion.coordenadas
+
+    @property
+    def extremos(self):
+        return self._extremos[:len(self.aristas)]
+
+    def actualizar(self):
+        return self.disposicion.actualizar(self.grafo)
+
+    def activar_comunidades(self):
+        # Guarda el id de comunidad de cada fila; desde entonces lo mantienen
+        # los avisos de comunidad_cambiada, sin volver a leer las comunidades.
+        if self._comunidades is None:
+            comunidad = self.grafo.comunidades()
+            self._comunidades = np.array([comunidad[nombre] for nombre in self.nombres],
+                                         dtype=np.int64).reshape(-1)
+
+    def colores(self, paleta, por_defecto):
+        # Devuelve un arreglo RGBA por fila para no convertir un color de
+        # texto por nodo al dibujar. Cada comunidad toma el color de su id,
+        # que no cambia mientras la comunidad no se una ni se divida.
+        n = len(self.nombres)
+        if self._comunidades is None:
+            tonos = np.full(n, len(paleta))
+        else:
+            tonos = self._comunidades[:n] % len(paleta)
+        return to_rgba_array(list(paleta) + [por_defecto])[tonos]
+
+    def grados(self):
+        return np.bincount(self.extremos.ravel(), minlength=len(self.nombres))
+
+    def recargado(self):
+        self.disposicion.reiniciar(self.grafo.adyacencia)
+        indices = self.indices
+        self.aristas = self.grafo.aristas()
+        self.posiciones_aristas = {arista: i for i, arista in enumerate(self.aristas)}
+        self._extremos = np.array([(indices[u], indices[v]) for u, v in self.aristas],
+                                  dtype=np.int64).reshape(-1, 2)
+        self._comunidades = None
+
+    def nodo_agregado(self, nombre):
+        fila = self.disposicion.agregar(nombre)
+        if self._comunidades is not None and fila == len(self._comunidades):
+            # Su comunidad llega enseguida con comunidad_cambiada.
+            self._comunidades = np.concatenate((self._comunidades, np.zeros(max(16, fila), dtype=np.int64)))
+
+    def comunidad_cambiada(self, nodos, c):
+        if self._comunidades is not None:
+            indices = self.indices
+            self._comunidades[[indices[nodo] for nodo in nodos]] = c
+
+    def nodo_eliminado(self, nombre):
+        # Sus aristas ya se quitaron con arista_eliminada; si otro nodo pasó a
+        # ocupar su fila, se corrigen las aristas de ese nodo.
+        movido = self.disposicion.quitar(nombre)
+        if movido is None:
+            return
+        fila = self.indices[movido]
+        if self._comunidades is not None:
+            self._comunidades[fila] = self._comunidades[len(self.nombres)]
+        posiciones = self.posiciones_aristas
+        for v in self.grafo.adyacencia[movido]:
+            self._extremos[posiciones[movido, v], 0] = fila
+        for u in self.grafo.entrantes[movido]:
+            self._extremos[posiciones[u, movido], 1] = fila
+
+    def arista_agregada(self, u, v):
+        posicion = len(self.aristas)
+        if posicion == len(self._extremos):
+            self._extremos = np.concatenate((self._extremos, np.zeros((max(16, posicion), 2), dtype=np.int64)))
+        self._extremos[posicion] = self.indices[u], self.indices[v]
+        self.aristas.append((u, v))
+        self.posiciones_aristas[u, v] = posicion
+        self.disposicion.marcar(u, v)
+
+    def arista_eliminada(self, u, v):
+        posicion = self.posiciones_aristas.pop((u, v))
+        ultima = self.aristas.pop()
+        if ultima != (u, v):
+            self.aristas[posicion] = ultima
+            self.posiciones_aristas[ultima] = posicion
+            self._extremos[posicion] = self._extremos[len(self.aristas)]
@@ -1,15 +1,25 @@
 #!/usr/bin/env python3
-import sys, time, math
+import sys
+from grafo_scc import Grafo, main as ejecutar_cli
+
+if __name__ == "__main__" and len(sys.argv) > 1:
+    sys.exit(ejecutar_cli())
+
+import time, math
+import numpy as np
 import customtkinter as ctk
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, filedialog
 from tkinter.scrolledtext import ScrolledText
-from collections import defaultdict
-import networkx as nx
 import matplotlib.pyplot as plt
+from matplotlib.patches import FancyArrowPatch, Rectangle
+from matplotlib.image import AxesImage
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from modelo_dibujo import ModeloDibujo
+from disposicion_grafo import Grilla, DISTANCIA
+from lista_virtual import ListaVirtual
+from indice_busqueda import IndiceBusqueda
 
-sys.setrecursionlimit(10000)
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
@@ -20,6 +30,28 @@ TIKTOK_SECONDARY = "#20D5EC"
 TIKTOK_TEXT = "#FFFFFF"
 TIKTOK_TEXT_SECONDARY = "#A0A0A0"
 
+TAMANO_NODO = 1500
+# A partir de esta cantidad de nodos o aristas la red se dibuja con una sola
+# colección de líneas y otra de puntos, y solo se rotulan los nodos con más
+# conexiones dentro de la vista.
+UMBRAL_COLECCIONES = 300
+MAX_ETIQUETAS = 40
+MAX_ARISTAS_VISIBLES = 15000
+# Mientras se arrastra o se usa la rueda se mueve una captura de la vista en
+# lugar de redibujar la red; el dibujo completo se hace al soltar el botón o
+# cuando pasan PAUSA_INTERACCION milisegundos sin eventos.
+INTERVALO_CUADRO = 15
+PAUSA_INTERACCION = 200
+# Distancias máximas para elegir un nodo, como fracción de la diagonal de la
+# vista.
+RADIO_DOBLE_CLICK = 0.05
+RADIO_GLOBO = 0.02
+MAX_SELECCION_LISTADA = 500
+# La búsqueda espera a que se deje de escribir y trae los resultados por
+# páginas a medida que se desplaza la lista.
+RETARDO_BUSQUEDA = 200
+RESULTADOS_POR_PAGINA = 100
+
 def centrar_ventana(parent, popup, w, h):
     parent.update_idletasks()
     pantalla_w = parent.winfo_screenwidth()
@@ -30,135 +62,40 @@ def centrar_ventana(parent, popup, w, h):
     popup.transient(parent)
     popup.grab_set()
 
-class Grafo:
-    def __init__(self):
-        self.adyacencia = defaultdict(list)
-    
-    def agregar_nodo(self, nombre):
-        if nombre not in self.adyacencia:
-            self.adyacencia[nombre] = []
-    
-    def agregar_arista(self, u, v):
-        if u not in self.adyacencia:
-            self.adyacencia[u] = []
-        if v not in self.adyacencia:
-            self.adyacencia[v] = []
-        if v not in self.adyacencia[u]:
-            self.adyacencia[u].append(v)
-    
-    def eliminar_nodo(self, nombre):
-        if nombre in self.adyacencia:
-            del self.adyacencia[nombre]
-        for u in list(self.adyacencia.keys()):
-            if nombre in self.adyacencia[u]:
-                self.adyacencia[u].remove(nombre)
-    
-    def eliminar_arista(self, u, v):
-        if u in self.adyacencia and v in self.adyacencia[u]:
-            self.adyacencia[u].remove(v)
-    
-    def nodos(self):
-        return list(self.adyacencia.keys())
-    
-    def aristas(self):
-        aristas = []
-        for u, vecinos in self.adyacencia.items():
-            for v in vecinos:
-                aristas.append((u, v))
-        return aristas
-    
-    def kosaraju_scc(self):
-        visitado = set()
-        pila = []
-        
-        def dfs_primera(u):
-            visitado.add(u)
-            for v in self.adyacencia[u]:
-                if v not in visitado:
-                    dfs_primera(v)
-            pila.append(u)
-        
-        for u in self.adyacencia:
-            if u not in visitado:
-                dfs_primera(u)
-        
-        grafo_transpuesto = defaultdict(list)
-        for u in self.adyacencia:
-            for v in self.adyacencia[u]:
-                grafo_transpuesto[v].append(u)
-        
-        for u in self.adyacencia:
-            grafo_transpuesto.setdefault(u, [])
-        
-        visitado.clear()
-        componentes = []
-        
-        def dfs_segunda(u, comp):
-            visitado.add(u)
-            comp.append(u)
-            for v in grafo_transpuesto[u]:
-                if v not in visitado:
-                    dfs_segunda(v, comp)
-        
-        while pila:
-            u = pila.pop()
-            if u not in visitado:
-                comp = []
-                dfs_segunda(u, comp)
-                componentes.append(comp)
-        
-        return componentes
-    
-    def tarjan_scc(self):
-        indice = 0
-        indices = {}
-        low = {}
-        en_pila = set()
-        pila = []
-        componentes = []
-        
-        def conexion_fuerte(v):
-            nonlocal indice
-            indices[v] = indice
-            low[v] = indice
-            indice += 1
-            pila.append(v)
-            en_pila.add(v)
-            
-            for w in self.adyacencia[v]:
-                if w not in indices:
-                    conexion_fuerte(w)
-                    low[v] = min(low[v], low[w])
-                elif w in en_pila:
-                    low[v] = min(low[v], indices[w])
-            
-            if low[v] == indices[v]:
-                comp = []
-                while True:
-                    w = pila.pop()
-                    en_pila.remove(w)
-                    comp.append(w)
-                    if w == v:
-                        break
-                componentes.append(comp)
-        
-        for v in self.adyacencia:
-            if v not in indices:
-                conexion_fuerte(v)
-        
-        return componentes
-
 class AppTikTok(ctk.CTk):
     def __init__(self):
         super().__init__()
         self.title("TikTok Network - Análisis de Comunidades")
         self.geometry("1400x900")
         self.configure(fg_color=TIKTOK_BG)
-        self.grafo = Grafo()
-        self.posiciones = {}
+        self.usar_grafo(Grafo())
+        self.segmentos = None
+        self.linea_aristas = None
+        self.puntos = None
+        self.grados = None
+        self.etiquetas = []
+        self.imagen_vista = None
+        self.fondo_vista = None
+        self.ocultos_vista = []
+        self.cuadro_pendiente = None
+        self.fin_pendiente = None
+        self.indice_nodos = None
+        self.nombres_indice = []
+        self.fondo_dibujo = None
+        self.globo = None
+        self.fila_globo = None
+        self.globo_pendiente = None
+        self.raton = None
+        self.inicio_seleccion = None
+        self.rectangulo_seleccion = None
+        self.marca_seleccion = None
         self.arrastrando = False
         self.ultimo_raton = None
         self.ventana_perfil_actual = None
+        self.perfil = None
+        self.listas_abiertas = []
+        self.refresco_pendiente = None
+        self.comunidades_activas = False
         
         plt.style.use('dark_background')
         
@@ -186,6 +123,8 @@ class AppTikTok(ctk.CTk):
             ("🗑️ Administrar", self.abrir_administrar, "#FF4444"),
             ("⚡ Kosaraju", self.ejecutar_kosaraju, "#25F4EE"),
             ("🔍 Tarjan", self.ejecutar_tarjan, "#FE2C55"),
+            ("💾 Guardar", self.guardar_red, "#FFD600"),
+            ("📂 Abrir", self.abrir_red, "#69C9D0"),
             ("🔄 Reiniciar", self.limpiar_grafo, "#696969")
         ]
         
@@ -243,7 +182,7 @@ class AppTikTok(ctk.CTk):
         stats_frame.pack(fill="x", padx=15, pady=(0,15))
         
         self.etiqueta_stats = ctk.CTkLabel(stats_frame,
-                                      text="📊 Estadísticas:\n• 0 creadores\n• 0 conexiones",
+                                      text=self.texto_estadisticas(),
                                       font=("Segoe UI", 11),
                                       text_color=TIKTOK_TEXT_SECONDARY,
                                       justify="left")
@@ -303,6 +242,7 @@ class AppTikTok(ctk.CTk):
         self.lienzo.mpl_connect('button_press_event', self.al_presionar_boton)
         self.lienzo.mpl_connect('button_release_event', self.al_soltar_boton)
         self.lienzo.mpl_connect('motion_notify_event', self.al_mover_raton)
+        self.lienzo.mpl_connect('draw_event', self.al_dibujar)
 
     def crear_panel_derecho(self, parent):
         titulo_frame = ctk.CTkFrame(parent, fg_color="transparent")
@@ -350,9 +290,8 @@ class AppTikTok(ctk.CTk):
         relx = (xdata - xlim_actual[0]) / (xlim_actual[1] - xlim_actual[0])
         rely = (ydata - ylim_actual[0]) / (ylim_actual[1] - ylim_actual[0])
         
-        ax.set_xlim([xdata - nuevo_ancho * relx, xdata + nuevo_ancho * (1 - relx)])
-        ax.set_ylim([ydata - nuevo_alto * rely, ydata + nuevo_alto * (1 - rely)])
-        self.lienzo.draw_idle()
+        self.mover_vista([xdata - nuevo_ancho * relx, xdata + nuevo_ancho * (1 - relx)],
+                         [ydata - nuevo_alto * rely, ydata + nuevo_alto * (1 - rely)])
 
     def al_presionar_boton(self, event):
         if event.dblclick and event.button == 1 and event.inaxes:
@@ -361,14 +300,29 @@ class AppTikTok(ctk.CTk):
         if event.button == 1 and event.inaxes:
             self.arrastrando = True
             self.ultimo_raton = (event.xdata, event.ydata)
+            self.ocultar_globo()
+        elif event.button == 3 and event.inaxes and self.modelo.nombres:
+            self.inicio_seleccion = (event.xdata, event.ydata)
+            self.ocultar_globo()
 
     def al_soltar_boton(self, event):
         if event.button == 1:
             self.arrastrando = False
             self.ultimo_raton = None
+            self.terminar_interaccion()
+        elif event.button == 3 and self.inicio_seleccion is not None:
+            self.terminar_seleccion()
 
     def al_mover_raton(self, event):
-        if not self.arrastrando or event.inaxes is None or event.xdata is None or event.ydata is None:
+        if event.inaxes is None or event.xdata is None or event.ydata is None:
+            return
+        if self.inicio_seleccion is not None:
+            self.raton = (event.xdata, event.ydata)
+            self.programar_globo()
+            return
+        if not self.arrastrando:
+            self.raton = (event.xdata, event.ydata)
+            self.programar_globo()
             return
         
         ax = event.inaxes
@@ -383,32 +337,178 @@ class AppTikTok(ctk.CTk):
         xlim_actual = ax.get_xlim()
         ylim_actual = ax.get_ylim()
         
-        ax.set_xlim(xlim_actual[0] + dx, xlim_actual[1] + dx)
-        ax.set_ylim(ylim_actual[0] + dy, ylim_actual[1] + dy)
-        
-        self.ultimo_raton = (event.xdata, event.ydata)
+        self.mover_vista((xlim_actual[0] + dx, xlim_actual[1] + dx),
+                         (ylim_actual[0] + dy, ylim_actual[1] + dy))
+        # Los datos del evento se calcularon con los límites anteriores.
+        self.ultimo_raton = (event.xdata + dx, event.ydata + dy)
+
+    def mover_vista(self, xlim, ylim):
+        if self.imagen_vista is None:
+            self.empezar_interaccion()
+        self.ejes.set_xlim(xlim)
+        self.ejes.set_ylim(ylim)
+        
+        # Los eventos seguidos del ratón se juntan en un solo cuadro.
+        if self.cuadro_pendiente is None:
+            self.cuadro_pendiente = self.after(INTERVALO_CUADRO, self.pintar_cuadro)
+        if self.fin_pendiente is not None:
+            self.after_cancel(self.fin_pendiente)
+        self.fin_pendiente = self.after(PAUSA_INTERACCION, self.terminar_interaccion)
+
+    def empezar_interaccion(self):
+        # Se captura la vista tal como está en pantalla y se reemplaza a todos
+        # los elementos de la red por esa imagen, ubicada en las coordenadas
+        # que ocupaba. Cada cuadro solo restaura el fondo vacío y dibuja la
+        # imagen con los nuevos límites.
+        ejes = self.ejes
+        self.ocultar_globo()
+        if self.figura.stale:
+            self.lienzo.draw()
+        x0, y0, x1, y1 = (int(round(v)) for v in ejes.bbox.extents)
+        pixeles = np.asarray(self.lienzo.get_renderer().buffer_rgba())
+        alto = pixeles.shape[0]
+        captura = pixeles[alto - y1:alto - y0, x0:x1].copy()
+        (xa, ya), (xb, yb) = ejes.transData.inverted().transform([(x0, y0), (x1, y1)])
+        
+        self.ocultos_vista = [artista for artista in (*ejes.collections, *ejes.patches, *ejes.texts, *ejes.lines)
+                              if artista.get_visible()]
+        for artista in self.ocultos_vista:
+            artista.set_visible(False)
+        self.lienzo.draw()
+        self.fondo_vista = self.lienzo.copy_from_bbox(ejes.bbox)
+        self.fondo_dibujo = None
+        
+        self.imagen_vista = AxesImage(ejes, extent=(xa, xb, ya, yb), origin='upper',
+                                      interpolation='nearest', animated=True)
+        self.imagen_vista.set_data(captura)
+        self.imagen_vista.set_clip_path(ejes.patch)
+        ejes.add_image(self.imagen_vista)
+
+    def pintar_cuadro(self):
+        self.cuadro_pendiente = None
+        if self.imagen_vista is None:
+            return
+        self.lienzo.restore_region(self.fondo_vista)
+        self.ejes.draw_artist(self.imagen_vista)
+        self.lienzo.blit(self.ejes.bbox)
+
+    def terminar_interaccion(self):
+        if self.fin_pendiente is not None:
+            self.after_cancel(self.fin_pendiente)
+            self.fin_pendiente = None
+        if self.imagen_vista is None or self.arrastrando:
+            return
+        self.imagen_vista.remove()
+        for artista in self.ocultos_vista:
+            artista.set_visible(True)
+        self.olvidar_interaccion()
+        self.actualizar_detalle()
         self.lienzo.draw_idle()
 
+    def olvidar_interaccion(self):
+        if self.cuadro_pendiente is not None:
+            self.after_cancel(self.cuadro_pendiente)
+        self.imagen_vista = None
+        self.fondo_vista = None
+        self.ocultos_vista = []
+        self.cuadro_pendiente = None
+
     def al_doble_click(self, event):
-        if event.inaxes is None or not self.posiciones:
+        fila = self.fila_cercana(event.xdata, event.ydata, RADIO_DOBLE_CLICK)
+        if fila is not None:
+            self.mostrar_perfil_tiktok(self.nombres_indice[fila])
+
+    def indice(self):
+        # El índice se rehace recién cuando se lo usa después de un cambio de
+        # posiciones; la copia lo protege de los cambios que el modelo aplique
+        # antes de descartarlo.
+        if self.indice_nodos is None and self.modelo.nombres:
+            self.indice_nodos = Grilla(self.modelo.coordenadas.copy(), DISTANCIA)
+            self.nombres_indice = list(self.modelo.nombres)
+        return self.indice_nodos
+
+    def fila_cercana(self, x, y, fraccion):
+        if self.indice() is None:
+            return None
+        (x0, x1), (y0, y1) = self.ejes.get_xlim(), self.ejes.get_ylim()
+        return self.indice_nodos.cercano(x, y, math.hypot(x1 - x0, y1 - y0) * fraccion)
+
+    def al_dibujar(self, event):
+        # Fondo para dibujar el globo y el rectángulo de selección encima sin
+        # volver a dibujar la red.
+        self.fondo_dibujo = self.lienzo.copy_from_bbox(self.figura.bbox)
+        self.fila_globo = None
+        if self.globo is not None:
+            self.globo.set_visible(False)
+
+    def programar_globo(self):
+        if self.globo_pendiente is None:
+            self.globo_pendiente = self.after(INTERVALO_CUADRO, self.mostrar_globo)
+
+    def mostrar_globo(self):
+        self.globo_pendiente = None
+        if self.globo is None or self.fondo_dibujo is None or self.imagen_vista is not None or self.raton is None:
             return
+        if self.inicio_seleccion is not None:
+            (xa, ya), (xb, yb) = self.inicio_seleccion, self.raton
+            self.rectangulo_seleccion.set_bounds(min(xa, xb), min(ya, yb), abs(xb - xa), abs(yb - ya))
+            self.rectangulo_seleccion.set_visible(True)
+            self.pintar_superpuestos()
+            return
+        fila = self.fila_cercana(*self.raton, RADIO_GLOBO)
+        if fila == self.fila_globo:
+            return
+        self.fila_globo = fila
+        if fila is None:
+            self.globo.set_visible(False)
+        else:
+            nodo = self.nombres_indice[fila]
+            self.globo.xy = self.indice_nodos.coordenadas[fila]
+            self.globo.set_text(f"@{nodo}\n{self.grafo.in_degree(nodo)} seguidores · "
+                                f"{self.grafo.out_degree(nodo)} siguiendo")
+            self.globo.set_visible(True)
+        self.pintar_superpuestos()
+
+    def ocultar_globo(self):
+        if self.globo is not None and self.globo.get_visible():
+            self.globo.set_visible(False)
+            self.fila_globo = None
+            self.pintar_superpuestos()
+
+    def pintar_superpuestos(self):
+        if self.fondo_dibujo is None:
+            return
+        self.lienzo.restore_region(self.fondo_dibujo)
+        for artista in (self.globo, self.rectangulo_seleccion):
+            if artista.get_visible():
+                self.ejes.draw_artist(artista)
+        self.lienzo.blit(self.figura.bbox)
+
+    def terminar_seleccion(self):
+        (xa, ya), (xb, yb) = self.inicio_seleccion, self.raton or self.inicio_seleccion
+        self.inicio_seleccion = None
+        self.rectangulo_seleccion.set_visible(False)
+        if self.indice() is None:
+            self.lienzo.draw_idle()
+            return
+        filas = self.indice_nodos.en_rectangulo(min(xa, xb), min(ya, yb), max(xa, xb), max(ya, yb))
+        seleccionados = sorted(self.nombres_indice[fila] for fila in filas.tolist())
         
-        x, y = event.xdata, event.ydata
-        mas_cercano = None
-        distancia_min = float('inf')
-        
-        for nodo, (nxp, nyp) in self.posiciones.items():
-            dist = math.hypot(x - nxp, y - nyp)
-            if dist < distancia_min:
-                distancia_min = dist
-                mas_cercano = nodo
-        
-        xlim = event.inaxes.get_xlim()
-        ylim = event.inaxes.get_ylim()
-        diagonal = math.hypot(xlim[1] - xlim[0], ylim[1] - ylim[0])
-        
-        if mas_cercano is not None and distancia_min <= diagonal * 0.05:
-            self.mostrar_perfil_tiktok(mas_cercano)
+        self.texto_salida.delete(1.0, tk.END)
+        self.texto_salida.insert(tk.END, f"🔲 Selección: {len(seleccionados)} creadores\n\n")
+        for nombre in seleccionados[:MAX_SELECCION_LISTADA]:
+            self.texto_salida.insert(tk.END, f"• @{nombre}\n")
+        if len(seleccionados) > MAX_SELECCION_LISTADA:
+            self.texto_salida.insert(tk.END, f"... y {len(seleccionados) - MAX_SELECCION_LISTADA} más\n")
+        
+        if self.marca_seleccion is not None:
+            self.marca_seleccion.remove()
+            self.marca_seleccion = None
+        if len(filas):
+            puntos = self.indice_nodos.coordenadas[filas]
+            self.marca_seleccion = self.ejes.scatter(puntos[:, 0], puntos[:, 1], s=60, facecolors='none',
+                                                     edgecolors=TIKTOK_ACCENT, linewidths=1.2, zorder=4)
+        self.lienzo.draw_idle()
 
     def mostrar_perfil_tiktok(self, usuario):
         if self.ventana_perfil_actual and self.ventana_perfil_actual.winfo_exists():
@@ -434,21 +534,17 @@ class AppTikTok(ctk.CTk):
                     font=("Segoe UI", 12),
                     text_color=TIKTOK_TEXT_SECONDARY).pack()
         
-        seguidores = [u for u, vecinos in self.grafo.adyacencia.items() if usuario in vecinos]
-        siguiendo = list(self.grafo.adyacencia.get(usuario, []))
+        seguidores = self.grafo.seguidores(usuario)
+        siguiendo = self.grafo.siguiendo(usuario)
         
         stats_frame = ctk.CTkFrame(header, fg_color="#1E1E1E", corner_radius=10)
         stats_frame.pack(fill="x", padx=20, pady=(0,20))
         
-        texto_stats = f"📊 Estadísticas del perfil\n\n"
-        texto_stats += f"👀 Seguidores: {len(seguidores)}\n"
-        texto_stats += f"❤️  Siguiendo: {len(siguiendo)}\n"
-        texto_stats += f"🔗 Total: {len(seguidores) + len(siguiendo)}"
-        
-        ctk.CTkLabel(stats_frame, text=texto_stats,
-                    font=("Segoe UI", 12),
-                    text_color=TIKTOK_TEXT,
-                    justify="left").pack(padx=15, pady=15)
+        etiqueta_stats = ctk.CTkLabel(stats_frame, text=self.texto_estadisticas_perfil(usuario),
+                                      font=("Segoe UI", 12),
+                                      text_color=TIKTOK_TEXT,
+                                      justify="left")
+        etiqueta_stats.pack(padx=15, pady=15)
         
         frame_eliminar = ctk.CTkFrame(header, fg_color="transparent")
         frame_eliminar.pack(fill="x", padx=20, pady=(0,10))
@@ -469,8 +565,17 @@ class AppTikTok(ctk.CTk):
         pestaña2 = pestañas.add("❤️  Siguiendo")
         pestaña3 = pestañas.add("🔍 Explorar")
         
-        self.configurar_pestaña_seguidores(pestaña1, seguidores, usuario)
-        self.configurar_pestaña_siguiendo(pestaña2, siguiendo, usuario)
+        # Lo que el perfil necesita para actualizarse cuando cambian las
+        # conexiones del usuario, sin volver a armar la ventana.
+        self.perfil = {
+            "usuario": usuario,
+            "ventana": popup,
+            "estadisticas": etiqueta_stats,
+            "seguidores": [pestaña1, seguidores, self.configurar_pestaña_seguidores(pestaña1, seguidores, usuario),
+                           {nombre: i for i, nombre in enumerate(seguidores)}],
+            "siguiendo": [pestaña2, siguiendo, self.configurar_pestaña_siguiendo(pestaña2, siguiendo, usuario),
+                          {nombre: i for i, nombre in enumerate(siguiendo)}],
+        }
         self.configurar_pestaña_explorar(pestaña3, usuario)
         
         ctk.CTkButton(popup, text="Cerrar Perfil", 
@@ -479,39 +584,24 @@ class AppTikTok(ctk.CTk):
                      hover_color="#696969",
                      height=40).pack(pady=20)
 
+    def texto_estadisticas_perfil(self, usuario):
+        seguidores = self.grafo.in_degree(usuario)
+        siguiendo = self.grafo.out_degree(usuario)
+        texto_stats = f"📊 Estadísticas del perfil\n\n"
+        texto_stats += f"👀 Seguidores: {seguidores}\n"
+        texto_stats += f"❤️  Siguiendo: {siguiendo}\n"
+        texto_stats += f"🔗 Total: {seguidores + siguiendo}"
+        return texto_stats
+
     def configurar_pestaña_seguidores(self, pestaña, seguidores, usuario_actual):
         pestaña.configure(fg_color=TIKTOK_CARD)
         
         if not seguidores:
             ctk.CTkLabel(pestaña, text="No tiene seguidores aún",
                         text_color=TIKTOK_TEXT_SECONDARY).pack(expand=True)
-            return
-            
-        frame_scroll = ctk.CTkScrollableFrame(pestaña, fg_color=TIKTOK_CARD)
-        frame_scroll.pack(fill="both", expand=True)
+            return None
         
-        for usuario in seguidores:
-            frame_usuario = ctk.CTkFrame(frame_scroll, fg_color="#1E1E1E", corner_radius=8)
-            frame_usuario.pack(fill="x", pady=2, padx=5)
-            
-            ctk.CTkLabel(frame_usuario, text=f"@{usuario}",
-                        font=("Segoe UI", 11),
-                        text_color=TIKTOK_TEXT).pack(side="left", padx=10, pady=8)
-            
-            if usuario in self.grafo.adyacencia.get(usuario_actual, []):
-                ctk.CTkButton(frame_usuario, text="Dejar de seguir",
-                             fg_color="#FF4444",
-                             hover_color="#CC0000",
-                             text_color=TIKTOK_TEXT,
-                             width=120,
-                             command=lambda u=usuario: self.dejar_de_seguir(usuario_actual, u)).pack(side="right", padx=10, pady=5)
-            else:
-                ctk.CTkButton(frame_usuario, text="Seguir",
-                             fg_color=TIKTOK_ACCENT,
-                             hover_color=self.ajustar_brillo(TIKTOK_ACCENT, 0.8),
-                             text_color=TIKTOK_TEXT,
-                             width=120,
-                             command=lambda u=usuario: self.seguir_usuario(usuario_actual, u)).pack(side="right", padx=10, pady=5)
+        return self.crear_lista_usuarios(pestaña, seguidores, usuario_actual)
 
     def configurar_pestaña_siguiendo(self, pestaña, siguiendo, usuario_actual):
         pestaña.configure(fg_color=TIKTOK_CARD)
@@ -519,94 +609,103 @@ class AppTikTok(ctk.CTk):
         if not siguiendo:
             ctk.CTkLabel(pestaña, text="No sigue a nadie aún",
                         text_color=TIKTOK_TEXT_SECONDARY).pack(expand=True)
-            return
-            
-        frame_scroll = ctk.CTkScrollableFrame(pestaña, fg_color=TIKTOK_CARD)
-        frame_scroll.pack(fill="both", expand=True)
+            return None
         
-        for usuario in siguiendo:
-            frame_usuario = ctk.CTkFrame(frame_scroll, fg_color="#1E1E1E", corner_radius=8)
-            frame_usuario.pack(fill="x", pady=2, padx=5)
-            
-            ctk.CTkLabel(frame_usuario, text=f"@{usuario}",
-                        font=("Segoe UI", 11),
-                        text_color=TIKTOK_TEXT).pack(side="left", padx=10, pady=8)
-            
-            ctk.CTkButton(frame_usuario, text="Dejar de seguir",
-                         fg_color="#FF4444",
-                         hover_color="#CC0000",
-                         text_color=TIKTOK_TEXT,
-                         width=120,
-                         command=lambda u=usuario: self.dejar_de_seguir(usuario_actual, u)).pack(side="right", padx=10, pady=5)
+        return self.crear_lista_usuarios(pestaña, siguiendo, usuario_actual)
 
     def configurar_pestaña_explorar(self, pestaña, usuario_actual):
         pestaña.configure(fg_color=TIKTOK_CARD)
-        frame_scroll = ctk.CTkScrollableFrame(pestaña, fg_color=TIKTOK_CARD)
-        frame_scroll.pack(fill="both", expand=True)
         
-        otros_usuarios = [u for u in self.grafo.nodos() if u != usuario_actual]
-        
-        if not otros_usuarios:
-            ctk.CTkLabel(frame_scroll, text="No hay otros usuarios para seguir",
+        if len(self.grafo.adyacencia) < 2:
+            ctk.CTkLabel(pestaña, text="No hay otros usuarios para seguir",
                         text_color=TIKTOK_TEXT_SECONDARY).pack(expand=True)
             return
             
-        frame_busqueda = ctk.CTkFrame(frame_scroll, fg_color="transparent")
+        frame_busqueda = ctk.CTkFrame(pestaña, fg_color="transparent")
         frame_busqueda.pack(fill="x", pady=(0,10))
         
         entrada_busqueda = ctk.CTkEntry(frame_busqueda, placeholder_text="Buscar usuarios...")
         entrada_busqueda.pack(fill="x", padx=5)
         
-        frame_usuarios = ctk.CTkFrame(frame_scroll, fg_color="transparent")
-        frame_usuarios.pack(fill="both", expand=True)
-        
-        def filtrar_usuarios(*args):
-            consulta = entrada_busqueda.get().lower()
-            for widget in frame_usuarios.winfo_children():
-                widget.destroy()
-            usuarios_mostrar = [u for u in otros_usuarios if consulta in u.lower()] if consulta else otros_usuarios
-            self.llenar_lista_usuarios(frame_usuarios, usuarios_mostrar, usuario_actual)
-        
-        entrada_busqueda.bind('<KeyRelease>', filtrar_usuarios)
-        self.llenar_lista_usuarios(frame_usuarios, otros_usuarios, usuario_actual)
+        lista = self.crear_lista_usuarios(pestaña, [], usuario_actual, marcar_siguiendo=True)
+        consulta = None
+        resultados = []
+        pendiente = None
+        
+        def cargar_pagina():
+            pagina, hay_mas = self.indice_busqueda.buscar(consulta, len(resultados), RESULTADOS_POR_PAGINA,
+                                                          excluir=usuario_actual)
+            resultados.extend(pagina)
+            lista.pedir_mas = cargar_pagina if hay_mas else None
+            lista.dibujar()
+        
+        def filtrar_usuarios():
+            nonlocal consulta, resultados, pendiente
+            pendiente = None
+            if not lista.winfo_exists() or entrada_busqueda.get() == consulta:
+                return
+            consulta = entrada_busqueda.get()
+            resultados = []
+            lista.mostrar(resultados)
+            cargar_pagina()
+        
+        def programar_filtro(*args):
+            nonlocal pendiente
+            if pendiente is not None:
+                pestaña.after_cancel(pendiente)
+            pendiente = pestaña.after(RETARDO_BUSQUEDA, filtrar_usuarios)
+        
+        entrada_busqueda.bind('<KeyRelease>', programar_filtro)
+        filtrar_usuarios()
 
-    def llenar_lista_usuarios(self, parent, usuarios, usuario_actual):
-        for usuario in usuarios:
-            frame_usuario = ctk.CTkFrame(parent, fg_color="#1E1E1E", corner_radius=8)
-            frame_usuario.pack(fill="x", pady=2, padx=5)
-            
-            ctk.CTkLabel(frame_usuario, text=f"@{usuario}",
-                        font=("Segoe UI", 11),
-                        text_color=TIKTOK_TEXT).pack(side="left", padx=10, pady=8)
-            
-            if usuario in self.grafo.adyacencia.get(usuario_actual, []):
-                ctk.CTkButton(frame_usuario, text="Siguiendo ✓",
-                             fg_color=TIKTOK_SECONDARY,
-                             hover_color=self.ajustar_brillo(TIKTOK_SECONDARY, 0.8),
-                             text_color=TIKTOK_BG,
-                             width=120,
-                             command=lambda u=usuario: self.dejar_de_seguir(usuario_actual, u)).pack(side="right", padx=10, pady=5)
-            else:
-                ctk.CTkButton(frame_usuario, text="Seguir",
-                             fg_color=TIKTOK_ACCENT,
-                             hover_color=self.ajustar_brillo(TIKTOK_ACCENT, 0.8),
-                             text_color=TIKTOK_TEXT,
-                             width=120,
-                             command=lambda u=usuario: self.seguir_usuario(usuario_actual, u)).pack(side="right", padx=10, pady=5)
+    def crear_lista_usuarios(self, parent, usuarios, usuario_actual, marcar_siguiendo=False):
+        # Solo se crean los widgets de las filas visibles, así que abrir una
+        # lista de cien mil seguidores cuesta lo mismo que una de diez.
+        lista = ListaVirtual(parent, self.crear_fila_usuario,
+                             lambda fila, usuario: self.llenar_fila_usuario(fila, usuario, usuario_actual,
+                                                                            marcar_siguiendo),
+                             fg_color=TIKTOK_CARD)
+        lista.pack(fill="both", expand=True)
+        lista.mostrar(usuarios)
+        self.listas_abiertas.append(lista)
+        return lista
+
+    def crear_fila_usuario(self, parent):
+        fila = ctk.CTkFrame(parent, fg_color="#1E1E1E", corner_radius=8)
+        fila.etiqueta = ctk.CTkLabel(fila, text="",
+                                     font=("Segoe UI", 11),
+                                     text_color=TIKTOK_TEXT)
+        fila.etiqueta.pack(side="left", padx=10, pady=8)
+        fila.boton = ctk.CTkButton(fila, text="", width=120)
+        fila.boton.pack(side="right", padx=10, pady=5)
+        return fila
+
+    def llenar_fila_usuario(self, fila, usuario, usuario_actual, marcar_siguiendo=False):
+        fila.etiqueta.configure(text=f"@{usuario}")
+        if usuario not in self.grafo.adyacencia.get(usuario_actual, ()):
+            fila.boton.configure(text="Seguir",
+                                 fg_color=TIKTOK_ACCENT,
+                                 hover_color=self.ajustar_brillo(TIKTOK_ACCENT, 0.8),
+                                 text_color=TIKTOK_TEXT,
+                                 command=lambda: self.seguir_usuario(usuario_actual, usuario))
+        elif marcar_siguiendo:
+            fila.boton.configure(text="Siguiendo ✓",
+                                 fg_color=TIKTOK_SECONDARY,
+                                 hover_color=self.ajustar_brillo(TIKTOK_SECONDARY, 0.8),
+                                 text_color=TIKTOK_BG,
+                                 command=lambda: self.dejar_de_seguir(usuario_actual, usuario))
+        else:
+            fila.boton.configure(text="Dejar de seguir",
+                                 fg_color="#FF4444",
+                                 hover_color="#CC0000",
+                                 text_color=TIKTOK_TEXT,
+                                 command=lambda: self.dejar_de_seguir(usuario_actual, usuario))
 
     def seguir_usuario(self, origen, destino):
         self.grafo.agregar_arista(origen, destino)
-        self.actualizar_ui()
-        if self.ventana_perfil_actual and self.ventana_perfil_actual.winfo_exists():
-            self.ventana_perfil_actual.destroy()
-            self.mostrar_perfil_tiktok(origen)
 
     def dejar_de_seguir(self, origen, destino):
         self.grafo.eliminar_arista(origen, destino)
-        self.actualizar_ui()
-        if self.ventana_perfil_actual and self.ventana_perfil_actual.winfo_exists():
-            self.ventana_perfil_actual.destroy()
-            self.mostrar_perfil_tiktok(origen)
 
     def eliminar_perfil_usuario(self, usuario, popup):
         if not messagebox.askyesno("Confirmar Eliminación", 
@@ -614,11 +713,7 @@ class AppTikTok(ctk.CTk):
             return
         
         popup.destroy()
-        if self.ventana_perfil_actual and self.ventana_perfil_actual.winfo_exists():
-            self.ventana_perfil_actual.destroy()
-        
         self.grafo.eliminar_nodo(usuario)
-        self.actualizar_ui()
         messagebox.showinfo("Perfil Eliminado", f"El perfil @{usuario} ha sido eliminado.")
 
     def abrir_administrar(self):
@@ -635,44 +730,51 @@ class AppTikTok(ctk.CTk):
                     font=("Segoe UI", 18, "bold"),
                     text_color=TIKTOK_TEXT).pack(pady=20)
         
-        frame_scroll = ctk.CTkScrollableFrame(popup, fg_color=TIKTOK_CARD)
-        frame_scroll.pack(fill="both", expand=True, padx=20, pady=10)
-        
-        for usuario in sorted(self.grafo.nodos()):
-            frame_perfil = ctk.CTkFrame(frame_scroll, fg_color="#1E1E1E", corner_radius=10)
-            frame_perfil.pack(fill="x", pady=5, padx=5)
+        def crear_fila_perfil(parent):
+            frame_perfil = ctk.CTkFrame(parent, fg_color="#1E1E1E", corner_radius=10)
             
             frame_info = ctk.CTkFrame(frame_perfil, fg_color="transparent")
             frame_info.pack(fill="x", padx=15, pady=10)
             
-            ctk.CTkLabel(frame_info, text=f"👤 @{usuario}",
-                        font=("Segoe UI", 14, "bold"),
-                        text_color=TIKTOK_TEXT).pack(anchor="w")
+            frame_perfil.titulo = ctk.CTkLabel(frame_info, text="",
+                                               font=("Segoe UI", 14, "bold"),
+                                               text_color=TIKTOK_TEXT)
+            frame_perfil.titulo.pack(anchor="w")
             
-            seguidores = [u for u, vecinos in self.grafo.adyacencia.items() if usuario in vecinos]
-            siguiendo = list(self.grafo.adyacencia.get(usuario, []))
-            
-            texto_stats = f"Seguidores: {len(seguidores)} | Siguiendo: {len(siguiendo)}"
-            ctk.CTkLabel(frame_info, text=texto_stats,
-                        font=("Segoe UI", 11),
-                        text_color=TIKTOK_TEXT_SECONDARY).pack(anchor="w")
+            frame_perfil.estadisticas = ctk.CTkLabel(frame_info, text="",
+                                                     font=("Segoe UI", 11),
+                                                     text_color=TIKTOK_TEXT_SECONDARY)
+            frame_perfil.estadisticas.pack(anchor="w")
             
             frame_acciones = ctk.CTkFrame(frame_perfil, fg_color="transparent")
             frame_acciones.pack(fill="x", padx=15, pady=(0,10))
             
-            ctk.CTkButton(frame_acciones, text="Ver Perfil",
-                         fg_color=TIKTOK_SECONDARY,
-                         hover_color=self.ajustar_brillo(TIKTOK_SECONDARY, 0.8),
-                         text_color=TIKTOK_BG,
-                         width=120,
-                         command=lambda u=usuario: self.mostrar_perfil_desde_administrar(u, popup)).pack(side="left", padx=5)
+            frame_perfil.ver = ctk.CTkButton(frame_acciones, text="Ver Perfil",
+                                             fg_color=TIKTOK_SECONDARY,
+                                             hover_color=self.ajustar_brillo(TIKTOK_SECONDARY, 0.8),
+                                             text_color=TIKTOK_BG,
+                                             width=120)
+            frame_perfil.ver.pack(side="left", padx=5)
             
-            ctk.CTkButton(frame_acciones, text="Eliminar Perfil",
-                         fg_color="#FF4444",
-                         hover_color="#CC0000",
-                         text_color=TIKTOK_TEXT,
-                         width=120,
-                         command=lambda u=usuario: self.eliminar_desde_administrar(u, popup)).pack(side="right", padx=5)
+            frame_perfil.eliminar = ctk.CTkButton(frame_acciones, text="Eliminar Perfil",
+                                                  fg_color="#FF4444",
+                                                  hover_color="#CC0000",
+                                                  text_color=TIKTOK_TEXT,
+                                                  width=120)
+            frame_perfil.eliminar.pack(side="right", padx=5)
+            return frame_perfil
+        
+        def llenar_fila_perfil(frame_perfil, usuario):
+            frame_perfil.titulo.configure(text=f"👤 @{usuario}")
+            frame_perfil.estadisticas.configure(
+                text=f"Seguidores: {self.grafo.in_degree(usuario)} | Siguiendo: {self.grafo.out_degree(usuario)}")
+            frame_perfil.ver.configure(command=lambda: self.mostrar_perfil_desde_administrar(usuario, popup))
+            frame_perfil.eliminar.configure(command=lambda: self.eliminar_desde_administrar(usuario, popup))
+        
+        lista = ListaVirtual(popup, crear_fila_perfil, llenar_fila_perfil, separacion=10, fg_color=TIKTOK_CARD)
+        lista.pack(fill="both", expand=True, padx=20, pady=10)
+        lista.mostrar(sorted(self.grafo.nodos()))
+        self.listas_abiertas.append(lista)
         
         ctk.CTkButton(popup, text="Cerrar",
                      command=popup.destroy,
@@ -690,13 +792,6 @@ class AppTikTok(ctk.CTk):
             return
         
         self.grafo.eliminar_nodo(usuario)
-        self.actualizar_ui()
-        
-        if self.ventana_perfil_actual and self.ventana_perfil_actual.winfo_exists():
-            self.ventana_perfil_actual.destroy()
-        
-        popup_administrar.destroy()
-        self.abrir_administrar()
         messagebox.showinfo("Perfil Eliminado", f"El perfil @{usuario} ha sido eliminado.")
 
     def abrir_explorar(self):
@@ -729,41 +824,19 @@ class AppTikTok(ctk.CTk):
         frame_lista = ctk.CTkFrame(popup, fg_color="transparent")
         frame_lista.pack(fill="both", expand=True, padx=20, pady=10)
         
+        lista = None
+        
         def actualizar_lista_usuarios(*args):
+            nonlocal lista
             origen_actual = variable_origen.get()
             if not origen_actual:
                 return
             
-            for widget in frame_lista.winfo_children():
-                widget.destroy()
-            
-            frame_scroll = ctk.CTkScrollableFrame(frame_lista, fg_color=TIKTOK_CARD)
-            frame_scroll.pack(fill="both", expand=True)
-            
             otros_usuarios = [u for u in self.grafo.nodos() if u != origen_actual]
             
-            for usuario in otros_usuarios:
-                frame_usuario = ctk.CTkFrame(frame_scroll, fg_color="#1E1E1E", corner_radius=8)
-                frame_usuario.pack(fill="x", pady=2, padx=5)
-                
-                ctk.CTkLabel(frame_usuario, text=f"@{usuario}",
-                            font=("Segoe UI", 11),
-                            text_color=TIKTOK_TEXT).pack(side="left", padx=10, pady=8)
-                
-                if usuario in self.grafo.adyacencia.get(origen_actual, []):
-                    ctk.CTkButton(frame_usuario, text="Dejar de seguir",
-                                 fg_color="#FF4444",
-                                 hover_color="#CC0000",
-                                 text_color=TIKTOK_TEXT,
-                                 width=120,
-                                 command=lambda u=usuario: self.dejar_de_seguir(origen_actual, u)).pack(side="right", padx=10, pady=5)
-                else:
-                    ctk.CTkButton(frame_usuario, text="Seguir",
-                                 fg_color=TIKTOK_ACCENT,
-                                 hover_color=self.ajustar_brillo(TIKTOK_ACCENT, 0.8),
-                                 text_color=TIKTOK_TEXT,
-                                 width=120,
-                                 command=lambda u=usuario: self.seguir_usuario(origen_actual, u)).pack(side="right", padx=10, pady=5)
+            if lista is not None:
+                lista.destroy()
+            lista = self.crear_lista_usuarios(frame_lista, otros_usuarios, origen_actual)
         
         variable_origen.trace('w', actualizar_lista_usuarios)
         combo_origen.set(self.grafo.nodos()[0] if self.grafo.nodos() else "")
@@ -801,7 +874,6 @@ class AppTikTok(ctk.CTk):
                 messagebox.showwarning("Advertencia", "El usuario ya existe")
                 return
             self.grafo.agregar_nodo(nombre)
-            self.actualizar_ui()
             popup.destroy()
             messagebox.showinfo("¡Éxito!", f"🎉 Perfil @{nombre} creado")
         
@@ -841,22 +913,184 @@ class AppTikTok(ctk.CTk):
         
         self.texto_salida.insert(tk.END, f"\n⏱️  Tiempo: {tiempo_ejecucion:.6f} segundos\n")
         self.texto_salida.insert(tk.END, f"📊 Total comunidades: {len(componentes)}\n")
+        condensacion = self.grafo.condensacion()
+        self.texto_salida.insert(tk.END, f"🔗 Enlaces entre comunidades: {len(condensacion.aristas())}\n")
         
-        self.dibujar_grafo(componentes)
+        self.comunidades_activas = True
+        self.dibujar_grafo()
+
+    def guardar_red(self):
+        if not self.grafo.adyacencia:
+            messagebox.showinfo("Info", "No hay perfiles para guardar")
+            return
+        ruta = filedialog.asksaveasfilename(parent=self, defaultextension=".sccg",
+                                            filetypes=[("Red TikTok", "*.sccg")])
+        if not ruta:
+            return
+        self.grafo.guardar_snapshot(ruta)
+        messagebox.showinfo("Guardado", f"Red guardada en {ruta}")
+
+    def abrir_red(self):
+        ruta = filedialog.askopenfilename(parent=self, filetypes=[("Red TikTok", "*.sccg")])
+        if not ruta:
+            return
+        try:
+            snapshot = Grafo.cargar_snapshot(ruta)
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Error", f"No se pudo abrir la red:\n{error}")
+            return
+        try:
+            grafo = snapshot.a_grafo()
+        except (IndexError, ValueError) as error:
+            messagebox.showerror("Error", f"No se pudo abrir la red:\n{error}")
+            return
+        finally:
+            snapshot.cerrar()
+        self.usar_grafo(grafo)
+        self.comunidades_activas = False
+        self.texto_salida.delete(1.0, tk.END)
+        if self.ventana_perfil_actual and self.ventana_perfil_actual.winfo_exists():
+            self.ventana_perfil_actual.destroy()
+        self.actualizar_ui()
 
     def limpiar_grafo(self):
         if messagebox.askyesno("Confirmar","¿Eliminar todos los perfiles y conexiones?"):
-            self.grafo = Grafo()
+            self.usar_grafo(Grafo())
+            self.comunidades_activas = False
             self.actualizar_ui()
             self.texto_salida.delete(1.0, tk.END)
             if self.ventana_perfil_actual and self.ventana_perfil_actual.winfo_exists():
                 self.ventana_perfil_actual.destroy()
             messagebox.showinfo("Listo", "Red reiniciada")
 
+    def usar_grafo(self, grafo):
+        self.grafo = grafo
+        self.modelo = ModeloDibujo(grafo)
+        self.indice_busqueda = IndiceBusqueda(grafo)
+        grafo.observar(self)
+
+    # Avisos del Grafo: cada cambio actualiza solo las filas, botones y
+    # contadores que muestran a los usuarios afectados, y el dibujo de la red
+    # se rehace una sola vez cuando termina la operación, aunque el Grafo
+    # avise varias aristas seguidas.
+    def nodo_agregado(self, nombre):
+        self.lista_nodos.insert(self.posicion_en_lista_nodos(nombre), f"@{nombre}")
+        self.programar_refresco()
+
+    def nodo_eliminado(self, nombre):
+        posicion = self.posicion_en_lista_nodos(nombre)
+        if self.lista_nodos.get(posicion) == f"@{nombre}":
+            self.lista_nodos.delete(posicion)
+        if self.perfil is not None and self.perfil["usuario"] == nombre:
+            if self.perfil["ventana"].winfo_exists():
+                self.perfil["ventana"].destroy()
+            self.perfil = None
+        for lista in self.listas_vivas():
+            lista.quitar(nombre)
+        self.programar_refresco()
+
+    def arista_agregada(self, u, v):
+        self.cambio_de_arista(u, v, True)
+
+    def arista_eliminada(self, u, v):
+        self.cambio_de_arista(u, v, False)
+
+    def recargado(self):
+        self.actualizar_ui()
+
+    def comunidad_cambiada(self, nodos, c):
+        # El modelo de dibujo ya lleva el color de cada fila.
+        pass
+
+    def cambio_de_arista(self, u, v, agregada):
+        perfil = self.perfil
+        if perfil is not None and not perfil["ventana"].winfo_exists():
+            perfil = self.perfil = None
+        if perfil is not None and perfil["usuario"] in (u, v):
+            if perfil["usuario"] == u:
+                self.actualizar_pestaña_perfil("siguiendo", v, agregada)
+            if perfil["usuario"] == v:
+                self.actualizar_pestaña_perfil("seguidores", u, agregada)
+            perfil["estadisticas"].configure(text=self.texto_estadisticas_perfil(perfil["usuario"]))
+        for lista in self.listas_vivas():
+            lista.refrescar_elemento(u)
+            lista.refrescar_elemento(v)
+        self.programar_refresco()
+
+    def actualizar_pestaña_perfil(self, clave, usuario, agregado):
+        pestaña, usuarios, lista, posiciones = self.perfil[clave]
+        if agregado:
+            posiciones[usuario] = len(usuarios)
+            usuarios.append(usuario)
+        elif usuario in posiciones:
+            # El último usuario pasa al lugar del que se quita, para no correr
+            # la lista entera en perfiles con muchos seguidores.
+            posicion = posiciones.pop(usuario)
+            ultimo = usuarios.pop()
+            if ultimo != usuario:
+                usuarios[posicion] = ultimo
+                posiciones[ultimo] = posicion
+        if lista is not None and usuarios:
+            lista.refrescar()
+            return
+        # La pestaña pasa de vacía a tener usuarios o al revés.
+        for widget in pestaña.winfo_children():
+            widget.destroy()
+        configurar = self.configurar_pestaña_seguidores if clave == "seguidores" else self.configurar_pestaña_siguiendo
+        self.perfil[clave][2] = configurar(pestaña, usuarios, self.perfil["usuario"])
+
+    def listas_vivas(self):
+        self.listas_abiertas = [lista for lista in self.listas_abiertas if lista.winfo_exists()]
+        return self.listas_abiertas
+
+    def posicion_en_lista_nodos(self, nombre):
+        # La lista está ordenada, así que se busca por bisección sin leerla
+        # entera.
+        inicio, fin = 0, self.lista_nodos.size()
+        while inicio < fin:
+            medio = (inicio + fin) // 2
+            if self.lista_nodos.get(medio)[1:] < nombre:
+                inicio = medio + 1
+            else:
+                fin = medio
+        return inicio
+
+    def programar_refresco(self):
+        if self.refresco_pendiente is None:
+            self.refresco_pendiente = self.after_idle(self.refrescar_pendiente)
+
+    def refrescar_pendiente(self):
+        self.refresco_pendiente = None
+        self.actualizar_estadisticas()
+        if not self.aplicar_cambios():
+            self.dibujar_grafo()
+
+    def aplicar_cambios(self):
+        # Lleva los cambios de la red a las colecciones ya dibujadas: se
+        # actualizan los arreglos de aristas y puntos sin rehacer los
+        # artistas. Devuelve False si hay que dibujar todo de nuevo, porque la
+        # red cambió de modo de dibujo o la disposición se reacomodó entera.
+        modelo = self.modelo
+        if self.linea_aristas is None or max(len(modelo.nombres), len(modelo.extremos)) <= UMBRAL_COLECCIONES:
+            return False
+        if modelo.actualizar() is None:
+            return False
+        coordenadas = modelo.coordenadas
+        self.grados = modelo.grados()
+        self.segmentos = coordenadas[modelo.extremos]
+        self.puntos.set_offsets(coordenadas)
+        self.puntos.set_sizes(6 + 3 * np.sqrt(self.grados))
+        self.puntos.set_facecolor(self.colores())
+        self.indice_nodos = None
+        if self.imagen_vista is None:
+            self.actualizar_detalle()
+            self.lienzo.draw_idle()
+        return True
+
     def actualizar_ui(self):
         self.actualizar_lista_nodos()
         self.actualizar_estadisticas()
-        self.dibujar_grafo([])
+        self.dibujar_grafo()
 
     def actualizar_lista_nodos(self):
         self.lista_nodos.delete(0, tk.END)
@@ -864,28 +1098,44 @@ class AppTikTok(ctk.CTk):
             self.lista_nodos.insert(tk.END, f"@{nodo}")
 
     def actualizar_estadisticas(self):
-        num_nodos = len(self.grafo.nodos())
-        num_aristas = len(self.grafo.aristas())
-        self.etiqueta_stats.configure(
-            text=f"📊 Estadísticas:\n• {num_nodos} creadores\n• {num_aristas} conexiones"
-        )
+        self.etiqueta_stats.configure(text=self.texto_estadisticas())
 
-    def dibujar_grafo(self, componentes):
+    def texto_estadisticas(self):
+        stats = self.grafo.estadisticas()
+        texto = f"📊 Estadísticas:\n• {stats['nodos']} creadores\n• {stats['aristas']} conexiones"
+        texto += f"\n• {stats['grado_medio']:.2f} seguidos por creador"
+        texto += f"\n• {stats['max_entrada']} seguidores como máximo"
+        texto += f"\n• {stats['reciprocidad']:.0%} de conexiones mutuas"
+        return texto
+
+    def dibujar_grafo(self):
+        if self.fin_pendiente is not None:
+            self.after_cancel(self.fin_pendiente)
+            self.fin_pendiente = None
+        self.olvidar_interaccion()
         self.ejes.clear()
-        G = nx.DiGraph()
-        G.add_nodes_from(self.grafo.nodos())
-        G.add_edges_from(self.grafo.aristas())
-        
-        paleta_colores = ['#FE2C55', '#25F4EE', '#FFFFFF', '#FFD600', '#69C9D0', '#EE1D52', '#20D5EC']
-        mapa_colores = {}
-        
-        for i, comp in enumerate(componentes):
-            for nodo in comp: 
-                mapa_colores[nodo] = paleta_colores[i % len(paleta_colores)]
-        
-        colores = [mapa_colores.get(n, "#A0A0A0") for n in G.nodes()]
-        
-        if len(G.nodes()) == 0:
+        self.segmentos = None
+        self.linea_aristas = None
+        self.puntos = None
+        self.etiquetas = []
+        self.marca_seleccion = None
+        self.inicio_seleccion = None
+        self.fila_globo = None
+        modelo = self.modelo
+        
+        # El globo y el rectángulo de selección no entran en el dibujo
+        # completo: se pintan encima con blit.
+        self.globo = self.ejes.annotate("", xy=(0, 0), xytext=(10, 10), textcoords="offset points",
+                                        fontsize=9, color=TIKTOK_TEXT, animated=True, visible=False, zorder=5,
+                                        bbox=dict(boxstyle="round,pad=0.4", facecolor="#1E1E1E",
+                                                  edgecolor=TIKTOK_ACCENT, alpha=0.95))
+        self.rectangulo_seleccion = Rectangle((0, 0), 0, 0, fill=False, edgecolor=TIKTOK_SECONDARY,
+                                              linestyle='--', linewidth=1.0, animated=True, visible=False)
+        self.ejes.add_artist(self.rectangulo_seleccion)
+        
+        if not modelo.nombres:
+            self.indice_nodos = None
+            self.nombres_indice = []
             self.ejes.text(0.5, 0.5, "Bienvenido a TikTok Network\n\nCrea tu primer perfil\npara empezar a conectar",
                         horizontalalignment='center', verticalalignment='center', 
                         fontsize=14, color=TIKTOK_TEXT, transform=self.ejes.transAxes)
@@ -893,23 +1143,16 @@ class AppTikTok(ctk.CTk):
             self.lienzo.draw_idle()
             return
         
-        self.posiciones = nx.spring_layout(G, seed=42)
+        # La disposición se conserva entre dibujos: solo se recalculan los
+        # nodos nuevos o los que cambiaron de conexiones.
+        modelo.actualizar()
+        self.indice_nodos = None
+        colores = self.colores()
         
-        nx.draw_networkx_edges(G, self.posiciones, ax=self.ejes, 
-                              arrowstyle='-|>', arrowsize=20, width=2.0,
-                              connectionstyle='arc3,rad=0.1', 
-                              edge_color=TIKTOK_TEXT_SECONDARY, alpha=0.6)
-        
-        nx.draw_networkx_nodes(G, self.posiciones, ax=self.ejes, 
-                              node_color=colores, node_size=1500,
-                              edgecolors=TIKTOK_TEXT, linewidths=2.0,
-                              alpha=0.9)
-        
-        nx.draw_networkx_labels(G, self.posiciones, ax=self.ejes, 
-                               font_size=10, font_weight='bold',
-                               font_family='Segoe UI',
-                               bbox=dict(boxstyle="round,pad=0.3", facecolor=TIKTOK_CARD, 
-                                        edgecolor='none', alpha=0.8))
+        if max(len(modelo.nombres), len(modelo.extremos)) > UMBRAL_COLECCIONES:
+            self.dibujar_colecciones(colores)
+        else:
+            self.dibujar_detallado(colores)
         
         self.ejes.set_title("Red de TikTok - Comunidades de Seguidores", 
                          fontsize=16, color=TIKTOK_TEXT, pad=20)
@@ -917,6 +1160,87 @@ class AppTikTok(ctk.CTk):
         self.ejes.axis("off")
         self.lienzo.draw_idle()
 
+    def colores(self):
+        if self.comunidades_activas:
+            self.modelo.activar_comunidades()
+        paleta_colores = ['#FE2C55', '#25F4EE', '#FFFFFF', '#FFD600', '#69C9D0', '#EE1D52', '#20D5EC']
+        return self.modelo.colores(paleta_colores, "#A0A0A0")
+
+    def dibujar_detallado(self, colores):
+        modelo = self.modelo
+        coordenadas = modelo.coordenadas
+        
+        # Las flechas terminan en el borde del círculo de cada nodo.
+        radio = math.sqrt(TAMANO_NODO) / 2
+        for origen, destino in modelo.extremos.tolist():
+            self.ejes.add_patch(FancyArrowPatch(coordenadas[origen], coordenadas[destino],
+                                                arrowstyle='-|>', mutation_scale=20, linewidth=2.0,
+                                                connectionstyle='arc3,rad=0.1',
+                                                shrinkA=radio, shrinkB=radio,
+                                                color=TIKTOK_TEXT_SECONDARY, alpha=0.6, zorder=1))
+        
+        self.ejes.scatter(coordenadas[:, 0], coordenadas[:, 1],
+                          s=TAMANO_NODO, c=colores,
+                          edgecolors=TIKTOK_TEXT, linewidths=2.0,
+                          alpha=0.9, zorder=2)
+        
+        for nombre, (x, y) in zip(modelo.nombres, coordenadas.tolist()):
+            self.ejes.text(x, y, nombre, fontsize=10, fontweight='bold',
+                           fontfamily='Segoe UI', color='k',
+                           horizontalalignment='center', verticalalignment='center',
+                           bbox=dict(boxstyle="round,pad=0.3", facecolor=TIKTOK_CARD, 
+                                     edgecolor='none', alpha=0.8),
+                           zorder=3)
+
+    def dibujar_colecciones(self, colores):
+        modelo = self.modelo
+        coordenadas = modelo.coordenadas
+        self.grados = modelo.grados()
+        self.segmentos = coordenadas[modelo.extremos]
+        
+        # Las aristas forman una sola línea cortada con NaN entre un segmento
+        # y el siguiente: actualizar_detalle le entrega solo las visibles, y
+        # cambiarlas es copiar un arreglo, sin armar un objeto por arista.
+        self.linea_aristas, = self.ejes.plot([], [], color=TIKTOK_TEXT_SECONDARY,
+                                             linewidth=0.4, alpha=0.35, zorder=1)
+        self.puntos = self.ejes.scatter(coordenadas[:, 0], coordenadas[:, 1],
+                                        s=6 + 3 * np.sqrt(self.grados), c=colores,
+                                        linewidths=0, zorder=2)
+        self.actualizar_detalle()
+
+    def actualizar_detalle(self):
+        # Con colecciones, solo se entregan a matplotlib las aristas que tocan
+        # la vista actual (como mucho MAX_ARISTAS_VISIBLES, elegidas por un
+        # hash fijo de su posición para que no parpadeen al mover la vista ni
+        # al agregar aristas), y se rotulan los nodos visibles con más
+        # conexiones.
+        if self.segmentos is None:
+            return
+        (x0, x1), (y0, y1) = self.ejes.get_xlim(), self.ejes.get_ylim()
+        xs = self.segmentos[:, :, 0]
+        ys = self.segmentos[:, :, 1]
+        visibles = np.flatnonzero((xs.max(axis=1) >= x0) & (xs.min(axis=1) <= x1) &
+                                  (ys.max(axis=1) >= y0) & (ys.min(axis=1) <= y1))
+        if len(visibles) > MAX_ARISTAS_VISIBLES:
+            prioridad = (visibles * 2654435761) & 0xFFFFFFFF
+            visibles = visibles[np.argpartition(prioridad, MAX_ARISTAS_VISIBLES)[:MAX_ARISTAS_VISIBLES]]
+        tramos = np.full((len(visibles), 3, 2), np.nan)
+        tramos[:, :2] = self.segmentos[visibles]
+        self.linea_aristas.set_data(tramos[:, :, 0].ravel(), tramos[:, :, 1].ravel())
+        
+        for etiqueta in self.etiquetas:
+            etiqueta.remove()
+        coordenadas = self.modelo.coordenadas
+        x, y = coordenadas[:, 0], coordenadas[:, 1]
+        filas = np.flatnonzero((x >= x0) & (x <= x1) & (y >= y0) & (y <= y1))
+        if len(filas) > MAX_ETIQUETAS:
+            filas = filas[np.argpartition(-self.grados[filas], MAX_ETIQUETAS)[:MAX_ETIQUETAS]]
+        nombres = self.modelo.nombres
+        self.etiquetas = [self.ejes.text(x[fila], y[fila], f" {nombres[fila]}", fontsize=8,
+                                         color=TIKTOK_TEXT, clip_on=True, zorder=3,
+                                         horizontalalignment='left', verticalalignment='bottom')
+                          for fila in filas.tolist()]
+
 if __name__ == "__main__":
     app = AppTikTok()
     app.mainloop()
\ No newline at end of file
@@ -0,0 +1,26 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+def matriz_adyacencia(grafo):
+    # Los arreglos CSR del grafo se envuelven sin copiarlos; los datos son
+    # un arreglo de unos de solo lectura que no ocupa memoria por arista.
+    n = len(grafo)
+    desplazamientos = np.frombuffer(grafo.desplazamientos, dtype=np.int64)
+    destinos = np.frombuffer(grafo.destinos, dtype=np.int32)
+    unos = np.broadcast_to(np.int8(1), destinos.shape)
+    return csr_matrix((unos, destinos, desplazamientos), shape=(n, n), copy=False)
+
+def etiquetas_scc(grafo):
+    if len(grafo) == 0:
+        return 0, np.zeros(0, dtype=np.int32)
+    return connected_components(matriz_adyacencia(grafo), directed=True, connection="strong")
+
+def scc_numpy(grafo):
+    cantidad, etiquetas = etiquetas_scc(grafo)
+    orden = np.argsort(etiquetas, kind="stable")
+    cortes = np.cumsum(np.bincount(etiquetas, minlength=cantidad)).tolist()
+
+    nombres = grafo.nombres
+    ordenados = [nombres[u] for u in orden.tolist()]
+    return [ordenados[inicio:fin] for inicio, fin in zip([0] + cortes[:-1], cortes)]
@@ -0,0 +1,145 @@
+import os, random
+from array import array
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from multiprocessing import shared_memory
+
+from grafo_scc import VecinosCSR, recortar_triviales, tarjan_subgrafo
+
+# Subconjuntos con menos vértices que esto se resuelven con Tarjan dentro del
+# proceso; los más grandes se recortan y se parten con un paso forward-backward.
+UMBRAL_SECUENCIAL = 20000
+MUESTRA_PIVOTE = 64
+
+class MemoriaCompartida:
+    # Copia los cuatro arreglos CSR (directo y transpuesto) a bloques de
+    # memoria compartida que los procesos hijos mapean sin copiarlos.
+    def __init__(self, grafo):
+        desplazamientos_t, origenes = grafo.transpuesto()
+        arreglos = (grafo.desplazamientos, grafo.destinos, desplazamientos_t, origenes)
+        self.bloques = []
+        for arreglo in arreglos:
+            datos = arreglo.tobytes()
+            bloque = shared_memory.SharedMemory(create=True, size=max(1, len(datos)))
+            bloque.buf[:len(datos)] = datos
+            self.bloques.append(bloque)
+        self.descriptor = [(bloque.name, len(arreglo), tipo)
+                           for bloque, arreglo, tipo in zip(self.bloques, arreglos, "qiqi")]
+
+    def liberar(self):
+        for bloque in self.bloques:
+            bloque.close()
+            bloque.unlink()
+        self.bloques = []
+
+_grafo_hijo = {}
+
+def _iniciar_hijo(descriptor, umbral):
+    bloques = []
+    vistas = []
+    for nombre, longitud, tipo in descriptor:
+        bloque = shared_memory.SharedMemory(name=nombre)
+        bloques.append(bloque)
+        tamano = longitud * (8 if tipo == "q" else 4)
+        vistas.append(bloque.buf[:tamano].cast(tipo))
+    _grafo_hijo["bloques"] = bloques
+    _grafo_hijo["nodos"] = len(vistas[0]) - 1
+    _grafo_hijo["adelante"] = VecinosCSR(vistas[0], vistas[1])
+    _grafo_hijo["atras"] = VecinosCSR(vistas[2], vistas[3])
+    _grafo_hijo["umbral"] = umbral
+
+class GradosSubconjunto(dict):
+    # Grados de los vértices del subconjunto; los de afuera valen -1 para
+    # que el recorte no los toque, sin reservar un arreglo del grafo entero.
+    def __missing__(self, u):
+        return -1
+
+def _alcanzables(pivote, vecinos, dentro):
+    visitados = {pivote}
+    pendientes = [pivote]
+    while pendientes:
+        for v in vecinos[pendientes.pop()]:
+            if v in dentro and v not in visitados:
+                visitados.add(v)
+                pendientes.append(v)
+    return visitados
+
+def _recortar(subconjunto, dentro, adelante, atras):
+    # Los grados cuentan solo las aristas dentro del subconjunto.
+    grado_salida = GradosSubconjunto((u, sum(map(dentro.__contains__, adelante[u]))) for u in subconjunto)
+    grado_entrada = GradosSubconjunto((u, sum(map(dentro.__contains__, atras[u]))) for u in subconjunto)
+    return recortar_triviales(subconjunto, adelante, atras, grado_entrada, grado_salida)
+
+def _elegir_pivote(subconjunto, adelante, atras):
+    # Un vértice con muchas aristas de entrada y salida suele caer en la
+    # componente gigante, que es la que más conviene separar primero. La
+    # muestra se toma al azar para no partir siempre desde un extremo en las
+    # redes con forma de cadena, donde cada paso separaría un solo vértice.
+    azar = random.Random(len(subconjunto))
+    muestra = azar.sample(range(len(subconjunto)), min(MUESTRA_PIVOTE, len(subconjunto)))
+    return max((subconjunto[i] for i in muestra), key=lambda u: len(adelante[u]) * len(atras[u]))
+
+def resolver_subconjunto(subconjunto):
+    # Un paso de FW-BW-Trim completo dentro del proceso hijo: recorta el
+    # subconjunto, resuelve con Tarjan lo que quede si es chico y si no lo
+    # parte desde un pivote. Devuelve los vértices recortados, las
+    # componentes resueltas y las partes que todavía hay que resolver.
+    # Sin subconjunto se toma el grafo entero, para no enviarlo.
+    adelante = _grafo_hijo["adelante"]
+    atras = _grafo_hijo["atras"]
+    umbral = _grafo_hijo["umbral"]
+    if subconjunto is None:
+        subconjunto = range(_grafo_hijo["nodos"])
+    dentro = set(subconjunto)
+    triviales = array('i')
+    if len(subconjunto) > umbral:
+        recorte = _recortar(subconjunto, dentro, adelante, atras)
+        triviales = array('i', recorte.triviales)
+        subconjunto = array('i', recorte.nucleo)
+        dentro = set(subconjunto)
+    if len(subconjunto) <= umbral:
+        return triviales, [array('i', comp) for comp in tarjan_subgrafo(adelante, dentro)], []
+    
+    pivote = _elegir_pivote(subconjunto, adelante, atras)
+    hacia_adelante = _alcanzables(pivote, adelante, dentro)
+    hacia_atras = _alcanzables(pivote, atras, dentro)
+    componente = hacia_adelante & hacia_atras
+    dentro -= hacia_adelante
+    dentro -= hacia_atras
+    partes = [array('i', parte) for parte in (hacia_adelante - componente, hacia_atras - componente, dentro)
+              if parte]
+    return triviales, [array('i', componente)], partes
+
+def canonicas(componentes):
+    return sorted(sorted(map(str, comp)) for comp in componentes)
+
+def scc_paralelo(grafo, procesos=None, verificar=False, umbral=None):
+    # El umbral viaja a los hijos como argumento: cambiar la constante del
+    # módulo no llega a procesos que arrancan de cero.
+    procesos = procesos or os.cpu_count() or 1
+    if umbral is None:
+        umbral = UMBRAL_SECUENCIAL
+    componentes_ids = []
+
+    memoria = MemoriaCompartida(grafo)
+    try:
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_hijo,
+                                 initargs=(memoria.descriptor, umbral)) as ejecutor:
+            # El proceso principal solo junta resultados y reparte las partes
+            # nuevas; recortes, búsquedas y particiones corren en los hijos.
+            pendientes = {ejecutor.submit(resolver_subconjunto, None)} if len(grafo) else set()
+            while pendientes:
+                listos, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                for futuro in listos:
+                    triviales, encontradas, partes = futuro.result()
+                    componentes_ids.extend((u,) for u in triviales)
+                    componentes_ids.extend(encontradas)
+                    for parte in partes:
+                        pendientes.add(ejecutor.submit(resolver_subconjunto, parte))
+    finally:
+        memoria.liberar()
+
+    nombres = grafo.nombres
+    componentes = [[nombres[u] for u in comp] for comp in componentes_ids]
+    if verificar and canonicas(componentes) != canonicas(grafo.tarjan_scc()):
+        raise RuntimeError("el resultado paralelo no coincide con el Tarjan secuencial")
+    return componentes
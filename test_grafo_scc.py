@@ -0,0 +1,301 @@
+import random, struct, sys
+
+import pytest
+
+from grafo_scc import Grafo, SNAPSHOT_CABECERA, main
+
+# Comprobaciones al azar contra una referencia por fuerza bruta: la red se
+# guarda aparte como diccionario de conjuntos y las comunidades salen de
+# comparar quién alcanza a quién.
+
+def alcanzables(referencia, u):
+    visitados = {u}
+    pendientes = [u]
+    while pendientes:
+        for v in referencia[pendientes.pop()]:
+            if v not in visitados:
+                visitados.add(v)
+                pendientes.append(v)
+    return visitados
+
+def scc_fuerza_bruta(referencia):
+    alcance = {u: alcanzables(referencia, u) for u in referencia}
+    return sorted(map(sorted, {frozenset(v for v in alcance[u] if u in alcance[v]) for u in referencia}))
+
+def canonicas(componentes):
+    return sorted(sorted(comp) for comp in componentes)
+
+def mutar(grafo, referencia, azar, nodos=12):
+    operacion = azar.random()
+    u = f"n{azar.randrange(nodos)}"
+    v = f"n{azar.randrange(nodos)}"
+    if operacion < 0.55:
+        grafo.agregar_arista(u, v)
+        referencia.setdefault(u, set()).add(v)
+        referencia.setdefault(v, set())
+    elif operacion < 0.85:
+        if v in referencia.get(u, ()):
+            grafo.eliminar_arista(u, v)
+            referencia[u].discard(v)
+    elif operacion < 0.93:
+        grafo.agregar_nodo(u)
+        referencia.setdefault(u, set())
+    elif u in referencia:
+        grafo.eliminar_nodo(u)
+        del referencia[u]
+        for salientes in referencia.values():
+            salientes.discard(u)
+
+@pytest.mark.parametrize("semilla", range(40))
+def test_scc_dinamico_coincide_con_fuerza_bruta(semilla):
+    azar = random.Random(semilla)
+    grafo = Grafo()
+    referencia = {}
+    grafo.componentes()
+
+    for _ in range(150):
+        mutar(grafo, referencia, azar)
+        componentes = grafo.componentes()
+        assert canonicas(componentes) == scc_fuerza_bruta(referencia)
+
+        # Las componentes salen en orden topológico de la condensación.
+        posicion = {nodo: i for i, comp in enumerate(componentes) for nodo in comp}
+        for u, salientes in referencia.items():
+            for v in salientes:
+                assert posicion[u] <= posicion[v]
+
+def test_scc_dinamico_renumera_ordenes_profundos():
+    # Un ciclo largo que se corta y se vuelve a cerrar muchas veces alarga
+    # las claves de orden hasta que hay que renumerarlas.
+    grafo = Grafo()
+    referencia = {}
+    nodos = [f"n{i}" for i in range(30)]
+    for u, v in zip(nodos, nodos[1:] + nodos[:1]):
+        grafo.agregar_arista(u, v)
+        referencia[u] = {v}
+    grafo.componentes()
+
+    azar = random.Random(7)
+    for _ in range(60):
+        i = azar.randrange(len(nodos))
+        u, v = nodos[i], nodos[(i + 1) % len(nodos)]
+        grafo.eliminar_arista(u, v)
+        referencia[u].discard(v)
+        assert canonicas(grafo.componentes()) == scc_fuerza_bruta(referencia)
+        grafo.agregar_arista(u, v)
+        referencia[u].add(v)
+        assert canonicas(grafo.componentes()) == scc_fuerza_bruta(referencia)
+
+    profundidad = grafo.scc_dinamico.PROFUNDIDAD_MAXIMA
+    assert all(len(orden) <= profundidad for orden in grafo.scc_dinamico.orden.values())
+
+@pytest.mark.parametrize("semilla", range(20))
+def test_alcanza_coincide_con_fuerza_bruta(semilla):
+    azar = random.Random(semilla)
+    grafo = Grafo()
+    referencia = {}
+    nodos = 25
+    for _ in range(8):
+        for _ in range(azar.randrange(5, 25)):
+            mutar(grafo, referencia, azar, nodos)
+        nombres = list(referencia) + ["ausente"]
+        for u in nombres:
+            alcance = alcanzables(referencia, u) if u in referencia else set()
+            for v in nombres:
+                assert grafo.alcanza(u, v) == (v in alcance)
+
+def test_alcanza_en_dag_profundo():
+    # Un DAG en capas con atajos obliga a pasar del etiquetado a la búsqueda.
+    azar = random.Random(3)
+    grafo = Grafo()
+    referencia = {}
+    capas = [[f"c{i}_{j}" for j in range(6)] for i in range(10)]
+    for anterior, siguiente in zip(capas, capas[1:]):
+        for u in anterior:
+            referencia.setdefault(u, set())
+            for v in azar.sample(siguiente, 2):
+                grafo.agregar_arista(u, v)
+                referencia[u].add(v)
+                referencia.setdefault(v, set())
+    for u in referencia:
+        alcance = alcanzables(referencia, u)
+        for v in referencia:
+            assert grafo.alcanza(u, v) == (v in alcance)
+
+@pytest.mark.parametrize("semilla", range(10))
+def test_estadisticas_coinciden_con_recuento(semilla):
+    azar = random.Random(semilla)
+    grafo = Grafo()
+    referencia = {}
+    for _ in range(200):
+        mutar(grafo, referencia, azar)
+        aristas = [(u, v) for u, salientes in referencia.items() for v in salientes]
+        entrada = {u: 0 for u in referencia}
+        for _, v in aristas:
+            entrada[v] += 1
+        salida = [len(salientes) for salientes in referencia.values()]
+        # Los bucles no cuentan como conexiones mutuas.
+        reciprocas = sum(u != v and u in referencia[v] for u, v in aristas)
+
+        stats = grafo.estadisticas(histogramas=True)
+        assert stats["nodos"] == len(referencia)
+        assert stats["aristas"] == len(aristas)
+        assert stats["max_entrada"] == max(entrada.values(), default=0)
+        assert stats["max_salida"] == max(salida, default=0)
+        assert stats["reciprocidad"] == (reciprocas / len(aristas) if aristas else 0.0)
+        for clave, grados in (("histograma_entrada", list(entrada.values())), ("histograma_salida", salida)):
+            assert stats[clave] == [grados.count(g) for g in range(max(grados) + 1 if grados else 0)]
+    assert "histograma_entrada" not in grafo.estadisticas()
+
+def red_al_azar(azar, nodos, pasos):
+    grafo = Grafo()
+    referencia = {}
+    for _ in range(pasos):
+        mutar(grafo, referencia, azar, nodos)
+    return grafo, referencia
+
+@pytest.mark.parametrize("semilla", range(20))
+def test_csr_coincide_con_grafo(semilla):
+    azar = random.Random(semilla)
+    grafo, referencia = red_al_azar(azar, 30, 120)
+    csr = grafo.compactar()
+    esperadas = scc_fuerza_bruta(referencia)
+    assert sorted(csr.aristas()) == sorted(grafo.aristas())
+    assert sorted(csr.nodos()) == sorted(grafo.nodos())
+    for red in (grafo, csr):
+        for recortar in (False, True):
+            assert canonicas(red.kosaraju_scc(recortar=recortar)) == esperadas
+            assert canonicas(red.tarjan_scc(recortar=recortar)) == esperadas
+        assert canonicas(red.scc(backend="numpy")) == esperadas
+
+@pytest.mark.parametrize("semilla", range(20))
+def test_recorte_solo_quita_comunidades_triviales(semilla):
+    azar = random.Random(semilla)
+    grafo, referencia = red_al_azar(azar, 30, 80)
+    triviales = {comp[0] for comp in scc_fuerza_bruta(referencia) if len(comp) == 1}
+    csr = grafo.compactar()
+    for recorte, nombre in ((grafo.recortar(), str), (csr.recortar(), csr.nombres.__getitem__)):
+        quitados = set(map(nombre, recorte.triviales))
+        assert quitados <= triviales
+        assert quitados.isdisjoint(map(nombre, recorte.nucleo))
+        assert recorte.informe()["nodos"] == len(referencia)
+
+def test_cargar_aristas_detecta_separador_por_linea(tmp_path):
+    ruta = tmp_path / "red.txt"
+    ruta.write_text("# comentario\n"
+                    "a\tb\n"
+                    "b,c\n"
+                    "c a\n"
+                    "a\tb\n"
+                    "\n"
+                    "solo\n"
+                    ",d\n"
+                    "d  e \n", encoding="utf-8")
+    grafo = Grafo()
+    carga = grafo.cargar_aristas(str(ruta))
+    assert sorted(grafo.aristas()) == [("a", "b"), ("b", "c"), ("c", "a"), ("d", "e")]
+    assert carga["aristas"] == 4
+    assert carga["duplicadas"] == 1
+    assert carga["ignoradas"] == 2
+    assert carga["nodos"] == 5
+    assert grafo.estadisticas()["aristas"] == 4
+    assert canonicas(grafo.tarjan_scc()) == [["a", "b", "c"], ["d"], ["e"]]
+
+def test_modificar_resultados_no_altera_el_cache():
+    grafo = Grafo()
+    grafo.agregar_arista("a", "b")
+    grafo.agregar_arista("b", "a")
+    grafo.agregar_nodo("c")
+    esperadas = canonicas(grafo.tarjan_scc())
+    for metodo in (grafo.tarjan_scc, grafo.kosaraju_scc, lambda: grafo.tarjan_scc(recortar=True),
+                   lambda: grafo.scc(backend="numpy")):
+        componentes = metodo()
+        componentes[0].append("zzz")
+        componentes.pop()
+        assert canonicas(metodo()) == esperadas
+        metodo().clear()
+        assert canonicas(metodo()) == esperadas
+    assert canonicas(grafo.condensacion().componentes) == esperadas
+
+def snapshot_de_prueba(tmp_path):
+    azar = random.Random(5)
+    grafo, _ = red_al_azar(azar, 30, 120)
+    grafo.agregar_nodo("ñandú")
+    ruta = tmp_path / "red.sccg"
+    grafo.guardar_snapshot(str(ruta))
+    return grafo, ruta
+
+def test_snapshot_ida_y_vuelta(tmp_path):
+    grafo, ruta = snapshot_de_prueba(tmp_path)
+    csr = Grafo.cargar_snapshot(str(ruta))
+    try:
+        assert list(csr.nodos()) == grafo.nodos()
+        assert sorted(csr.aristas()) == sorted(grafo.aristas())
+        assert canonicas(csr.tarjan_scc()) == canonicas(grafo.tarjan_scc())
+        copia = csr.a_grafo()
+    finally:
+        csr.cerrar()
+    assert copia.estadisticas(histogramas=True) == grafo.estadisticas(histogramas=True)
+
+@pytest.mark.parametrize("con_numpy", [True, False])
+def test_snapshot_danado_da_value_error(tmp_path, monkeypatch, con_numpy):
+    if not con_numpy:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+    grafo, ruta = snapshot_de_prueba(tmp_path)
+    datos = ruta.read_bytes()
+    n, m = len(grafo.adyacencia), grafo.cantidad_aristas
+    inicio_destinos = SNAPSHOT_CABECERA.size + 8 * (n + 1)
+
+    danados = {
+        "vacio": b"",
+        "cabecera": datos[:SNAPSHOT_CABECERA.size - 1],
+        "truncado": datos[:-1],
+        "sobrante": datos + b"\0",
+        "magia": b"XXXX" + datos[4:],
+    }
+    for destino in (-1, n, 99):
+        danados[f"destino {destino}"] = (datos[:inicio_destinos] + struct.pack("<i", destino)
+                                         + datos[inicio_destinos + 4:])
+    danados["desplazamiento"] = (datos[:SNAPSHOT_CABECERA.size + 8] + struct.pack("<q", m + 1)
+                                 + datos[SNAPSHOT_CABECERA.size + 16:])
+    for nombre, contenido in danados.items():
+        ruta.write_bytes(contenido)
+        with pytest.raises(ValueError):
+            Grafo.cargar_snapshot(str(ruta))
+        with pytest.raises(SystemExit, match="snapshot"):
+            main(["scc", str(ruta)])
+
+class CopiaDeComunidades:
+    # Observador que arma su propia copia de las comunidades solo con los avisos.
+    def __init__(self, grafo):
+        grafo.observar(self)
+        self.comunidad = dict(grafo.comunidades())
+
+    def comunidad_cambiada(self, nodos, c):
+        for nodo in nodos:
+            self.comunidad[nodo] = c
+
+    def nodo_eliminado(self, nombre):
+        del self.comunidad[nombre]
+
+    def nodo_agregado(self, nombre):
+        pass
+
+    def arista_agregada(self, u, v):
+        pass
+
+    def arista_eliminada(self, u, v):
+        pass
+
+@pytest.mark.parametrize("semilla", range(20))
+def test_avisos_de_comunidad_siguen_a_las_componentes(semilla):
+    azar = random.Random(semilla)
+    grafo, referencia = red_al_azar(azar, 15, 30)
+    copia = CopiaDeComunidades(grafo)
+    for _ in range(150):
+        mutar(grafo, referencia, azar, 15)
+        assert copia.comunidad == dict(grafo.comunidades())
+        grupos = {}
+        for nodo, c in copia.comunidad.items():
+            grupos.setdefault(c, []).append(nodo)
+        assert canonicas(grupos.values()) == scc_fuerza_bruta(referencia)
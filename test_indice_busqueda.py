@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+import indice_busqueda
+from grafo_scc import Grafo
+from indice_busqueda import IndiceBusqueda
+
+# Comprobaciones al azar contra una búsqueda lineal sobre todos los nombres.
+
+LETRAS = "abABñ_"
+
+def esperado(nombres, consulta, excluir=None):
+    consulta = consulta.lower()
+    claves = sorted((nombre.lower(), nombre) for nombre in nombres if nombre != excluir)
+    prefijos = [nombre for clave, nombre in claves if clave.startswith(consulta)]
+    contienen = [nombre for clave, nombre in claves if consulta in clave and not clave.startswith(consulta)]
+    return prefijos + contienen
+
+def nombre_al_azar(azar):
+    return "".join(azar.choice(LETRAS) for _ in range(azar.randint(1, 6)))
+
+@pytest.mark.parametrize("semilla", range(30))
+def test_coincidencias_con_altas_y_bajas(semilla, monkeypatch):
+    # Con pocos cambios tolerados el texto se rearma varias veces durante la
+    # prueba, y entre medio se combinan los agregados y quitados aparte.
+    monkeypatch.setattr(indice_busqueda, "MIN_CAMBIOS_TEXTO", 5)
+    azar = random.Random(semilla)
+    grafo = Grafo()
+    indice = IndiceBusqueda(grafo)
+    for _ in range(40):
+        grafo.agregar_nodo(nombre_al_azar(azar))
+
+    for paso in range(200):
+        if azar.random() < 0.6 or not grafo.adyacencia:
+            grafo.agregar_nodo(nombre_al_azar(azar))
+        else:
+            grafo.eliminar_nodo(azar.choice(list(grafo.adyacencia)))
+        if paso % 3 == 0:
+            consulta = nombre_al_azar(azar)[:azar.randint(0, 3)]
+            assert list(indice.coincidencias(consulta)) == esperado(grafo.adyacencia, consulta)
+
+def test_recargado_vuelve_a_leer_la_red(tmp_path):
+    grafo = Grafo()
+    indice = IndiceBusqueda(grafo)
+    grafo.agregar_nodo("Ana")
+    assert list(indice.coincidencias("an")) == ["Ana"]
+    ruta = tmp_path / "red.txt"
+    ruta.write_text("juana bruno\nmariana ana\n", encoding="utf-8")
+    grafo.cargar_aristas(str(ruta))
+    assert list(indice.coincidencias("an")) == ["Ana", "ana", "juana", "mariana"]
+
+@pytest.mark.parametrize("semilla", range(10))
+def test_buscar_por_paginas(semilla):
+    azar = random.Random(semilla)
+    grafo = Grafo()
+    indice = IndiceBusqueda(grafo)
+    for _ in range(300):
+        grafo.agregar_nodo(nombre_al_azar(azar))
+    nombres = list(grafo.adyacencia)
+    excluir = azar.choice(nombres)
+    consulta = azar.choice("ab")
+    todos = esperado(nombres, consulta, excluir)
+
+    hay_mas, desde = True, 0
+    recorridos = []
+    while hay_mas:
+        pagina, hay_mas = indice.buscar(consulta, desde, 7, excluir)
+        recorridos.extend(pagina)
+        desde += len(pagina)
+    assert recorridos == todos
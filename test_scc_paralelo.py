@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+from grafo_scc import Grafo, main
+from test_grafo_scc import canonicas, red_al_azar, scc_fuerza_bruta
+
+# El umbral chico obliga a recortar y partir subconjuntos de pocos vértices,
+# así que hasta grafos de prueba pasan por todos los pasos de FW-BW-Trim.
+
+@pytest.mark.parametrize("semilla", range(6))
+def test_paralelo_coincide_con_fuerza_bruta(semilla):
+    azar = random.Random(semilla)
+    grafo, referencia = red_al_azar(azar, 60, 300)
+    componentes = grafo.compactar().scc_paralelo(2, verificar=True, umbral=3)
+    assert canonicas(componentes) == scc_fuerza_bruta(referencia)
+
+def test_paralelo_en_cadena_y_ciclos():
+    grafo = Grafo()
+    for i in range(200):
+        grafo.agregar_arista(i, i + 1)
+    for i in range(300, 400):
+        grafo.agregar_arista(i, 300 + (i + 1) % 100)
+    grafo.agregar_arista(200, 350)
+    componentes = grafo.compactar().scc_paralelo(2, verificar=True, umbral=5)
+    assert canonicas(componentes) == canonicas(grafo.tarjan_scc())
+
+def test_paralelo_grafo_vacio():
+    assert Grafo().compactar().scc_paralelo(2, verificar=True) == []
+
+def test_cli_verificar(tmp_path, capsys):
+    ruta = tmp_path / "red.txt"
+    ruta.write_text("a b\nb a\nb c\n", encoding="utf-8")
+    assert main(["resumen", str(ruta), "--algoritmo", "paralelo", "--procesos", "2", "--verificar"]) == 0
+    assert "paralelo: 2 comunidades" in capsys.readouterr().out